@@ -36,6 +36,12 @@ class Settings(BaseSettings):
         15  # Short-lived access tokens for better security
     )
     jwt_refresh_token_expire_days: int = 7  # Longer refresh tokens for better UX
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor (2^rounds iterations) for bcrypt password hashes",
+    )
 
     # Keycloak SSO (optionnel - désactivé par défaut)
     keycloak_enabled: bool = False
@@ -53,6 +59,11 @@ class Settings(BaseSettings):
     api_prefix: str = "/api/v1"
     api_host: str = "localhost"
     api_port: int = 8000
+    api_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of uvicorn worker processes (defaults to a single worker)",
+    )
 
     # === API Public Configuration ===
     api_public_url: Optional[str] = Field(
@@ -196,6 +207,10 @@ class Settings(BaseSettings):
     enable_correlation_id: bool = Field(
         default=True, description="Enable correlation ID tracking"
     )
+    health_cache_ttl: int = Field(
+        default=5,
+        description="Seconds a /health result is cached in Redis (0 disables the cache)",
+    )
 
     # LiteLLM (optionnel - désactivé par défaut)
     litellm_enabled: bool = False
@@ -29,9 +29,9 @@
 #  SOFTWARE.
 #
 
-import random
-import string
-from typing import Optional
+import functools
+
+from . import codename
 
 adjectives = [
     # Appearance adjectives (6)
@@ -1258,52 +1258,10 @@ names = [
 ]
 
 
-def random_string(length: int) -> str:
-    return "".join(random.choices(string.ascii_lowercase + string.digits, k=length))
-
-
-def generate_codename(
-    prefix_length: int = 0,
-    use_adjective: bool = True,
-    use_adverb: bool = False,
-    suffix_length: int = 0,
-    separator: str = "-",
-    style: Optional[str] = None,
-) -> str:
-    # 🎨 Appliquer des presets par style
-    if style == "ubuntu":
-        use_adjective = True
-        use_adverb = False
-        prefix_length = 0
-        suffix_length = 3
-        separator = "-"
-    elif style == "docker":
-        use_adjective = False
-        use_adverb = True
-        prefix_length = 0
-        suffix_length = 4
-        separator = "-"
-    elif style == "full":
-        use_adjective = True
-        use_adverb = True
-        prefix_length = 3
-        suffix_length = 4
-        separator = "-"
-
-    parts = []
-
-    if prefix_length > 0:
-        parts.append(random_string(prefix_length))
-
-    if use_adverb:
-        parts.append(random.choice(adverbs))
-
-    if use_adjective:
-        parts.append(random.choice(adjectives))
-
-    parts.append(random.choice(names))  # always include a name
-
-    if suffix_length > 0:
-        parts.append(random_string(suffix_length))
-
-    return separator.join(parts)
+# Générateurs liés aux listes de mots de ce module
+generate_codenames = functools.partial(
+    codename.generate_codenames, adjectives, adverbs, names
+)
+generate_codename = functools.partial(
+    codename.generate_codename, adjectives, adverbs, names
+)
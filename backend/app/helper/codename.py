@@ -0,0 +1,118 @@
+"""
+Génération de noms de code aléatoires à partir de listes de mots.
+
+Moteur commun aux générateurs animalname, cosmicname et mythologyname, qui ne
+diffèrent que par leurs listes d'adjectifs, d'adverbes et de noms.
+"""
+
+import random
+import string
+from collections.abc import Sequence
+from typing import Optional
+
+# Alphabet des préfixes et suffixes aléatoires
+_ALPHABET = string.ascii_lowercase + string.digits
+
+
+def generate_codenames(
+    adjectives: Sequence[str],
+    adverbs: Sequence[str],
+    names: Sequence[str],
+    n: int,
+    prefix_length: int = 0,
+    use_adjective: bool = True,
+    use_adverb: bool = False,
+    suffix_length: int = 0,
+    separator: str = "-",
+    style: Optional[str] = None,
+) -> list[str]:
+    """Génère n noms de code en une passe (mêmes options que generate_codename)."""
+
+    # 🎨 Appliquer des presets par style
+    if style == "ubuntu":
+        use_adjective = True
+        use_adverb = False
+        prefix_length = 0
+        suffix_length = 3
+        separator = "-"
+    elif style == "docker":
+        use_adjective = False
+        use_adverb = True
+        prefix_length = 0
+        suffix_length = 4
+        separator = "-"
+    elif style == "full":
+        use_adjective = True
+        use_adverb = True
+        prefix_length = 3
+        suffix_length = 4
+        separator = "-"
+
+    prefix_length = max(prefix_length, 0)
+    suffix_length = max(suffix_length, 0)
+
+    # Un seul tirage par nom de code sur l'ensemble des combinaisons possibles,
+    # décomposé en base mixte : chaque partie reste uniforme et indépendante
+    pools: list[Sequence[str]] = [_ALPHABET] * prefix_length
+    if use_adverb:
+        pools.append(adverbs)
+    if use_adjective:
+        pools.append(adjectives)
+    pools.append(names)
+    pools.extend([_ALPHABET] * suffix_length)
+
+    sizes = [len(pool) for pool in pools]
+    total = 1
+    for size in sizes:
+        total *= size
+    words_end = len(pools) - suffix_length
+
+    codenames = []
+    for _ in range(n):
+        draw = random.randrange(total)
+        picks = []
+        for pool, size in zip(pools, sizes):
+            draw, index = divmod(draw, size)
+            picks.append(pool[index])
+
+        parts = picks[prefix_length:words_end]
+        if prefix_length:
+            parts.insert(0, "".join(picks[:prefix_length]))
+        if suffix_length:
+            parts.append("".join(picks[words_end:]))
+        codenames.append(separator.join(parts))
+
+    return codenames
+
+
+def generate_codename(
+    adjectives: Sequence[str],
+    adverbs: Sequence[str],
+    names: Sequence[str],
+    prefix_length: int = 0,
+    use_adjective: bool = True,
+    use_adverb: bool = False,
+    suffix_length: int = 0,
+    separator: str = "-",
+    style: Optional[str] = None,
+) -> str:
+    """
+    Génère un nom de code mémorisable composé de parties aléatoires.
+
+    Les styles reprennent des schémas connus :
+    - "ubuntu" : adjectif + nom + suffixe de 3 caractères
+    - "docker" : adverbe + nom + suffixe de 4 caractères
+    - "full" : préfixe de 3 caractères + adverbe + adjectif + nom + suffixe de 4 caractères
+    """
+    return generate_codenames(
+        adjectives,
+        adverbs,
+        names,
+        1,
+        prefix_length,
+        use_adjective,
+        use_adverb,
+        suffix_length,
+        separator,
+        style,
+    )[0]
@@ -1,7 +1,9 @@
 import binascii
 import calendar
+import collections
 import copy
 import datetime
+import functools
 import math
 import platform
 import random
@@ -102,6 +104,8 @@ step_search_re = re.compile(r"^([^-]+)-([^-/]+)(/(\d+))?$")
 only_int_re = re.compile(r"^\d+$")
 
 DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# One calendar per first weekday, shared by every nth weekday lookup
+CALENDARS = tuple(calendar.Calendar(firstweekday) for firstweekday in range(7))
 WEEKDAYS = "|".join(DOW_ALPHAS.keys())
 MONTHS = "|".join(M_ALPHAS.keys())
 star_or_int_re = re.compile(r"^(\d+|\*)$")
@@ -110,6 +114,7 @@ special_dow_re = re.compile(
     rf"|(({MONTHS})(-({MONTHS}))?)|\w+)#)|l)(?P<last>\d+)$"
 )
 re_star = re.compile("[*]")
+SIMPLE_FIELD_CHARS = frozenset("0123456789,-/*")
 hash_expression_re = re.compile(
     r"^(?P<hash_type>h|r)(\((?P<range_begin>\d+)-(?P<range_end>\d+)\))?(\/(?P<divisor>\d+))?$"
 )
@@ -128,8 +133,22 @@ YEAR_CRON_LEN = len(YEAR_FIELDS)
 # retrocompat
 VALID_LEN_EXPRESSION = {a for a in CRON_FIELDS if isinstance(a, int)}
 TIMESTAMP_TO_DT_CACHE: dict[tuple[float, str], datetime.datetime] = {}
-EXPRESSIONS: dict[tuple[str, Optional[bytes], bool], list[str]] = {}
+# Bounded LRU: cron strings may come from users, keep memory flat
+EXPRESSIONS_MAXSIZE = 10000
+EXPRESSIONS: "collections.OrderedDict[tuple[str, Optional[bytes], bool], list[str]]" = (
+    collections.OrderedDict()
+)
 MARKER = object()
+ONE_MICROSECOND_BACK = datetime.timedelta(microseconds=-1)
+ONE_SECOND = datetime.timedelta(seconds=1)
+ONE_MINUTE = datetime.timedelta(minutes=1)
+
+
+def _remember_expressions(key, expressions):
+    EXPRESSIONS[key] = expressions
+    EXPRESSIONS.move_to_end(key)
+    if len(EXPRESSIONS) > EXPRESSIONS_MAXSIZE:
+        EXPRESSIONS.popitem(last=False)
 
 
 def datetime_to_timestamp(d):
@@ -155,9 +174,13 @@ def _is_successor(
     date: datetime.datetime, previous_date: datetime.datetime, is_prev: bool
 ) -> bool:
     """Check if the given date is a successor (after/before) of the previous date."""
+    # Aware datetimes sharing a tzinfo compare on wall time and ignore `fold`,
+    # so compare the absolute timestamps rather than the datetimes themselves.
+    if date.tzinfo is not None and previous_date.tzinfo is not None:
+        date, previous_date = date.timestamp(), previous_date.timestamp()
     if is_prev:
-        return date.astimezone(UTC_DT) < previous_date.astimezone(UTC_DT)
-    return date.astimezone(UTC_DT) > previous_date.astimezone(UTC_DT)
+        return date < previous_date
+    return date > previous_date
 
 
 def _timezone_delta(
@@ -202,7 +225,7 @@ def _add_tzinfo(
             closer = localize(date, is_dst=not is_prev)
             farther = localize(date, is_dst=is_prev)
             # TODO: Check negative DST
-            assert (closer.astimezone(UTC_DT) > farther.astimezone(UTC_DT)) == is_prev
+            assert _is_successor(farther, closer, is_prev)
             if _is_successor(closer, previous_date, is_prev):
                 result = closer
             else:
@@ -221,7 +244,7 @@ def _add_tzinfo(
     # Comparing the UTC offsets in the check for the date being ambiguous.
     if result.utcoffset() != farther.utcoffset():
         # TODO: Check negative DST
-        assert (result.astimezone(UTC_DT) > farther.astimezone(UTC_DT)) == is_prev
+        assert _is_successor(farther, result, is_prev)
         if not _is_successor(result, previous_date, is_prev):
             assert _is_successor(farther, previous_date, is_prev)
             result = farther
@@ -257,6 +280,29 @@ class CroniterNotAlphaError(CroniterBadCronError):
 
 
 class croniter:
+    # Schedulers may keep one live instance per job: avoid a per-instance __dict__
+    __slots__ = (
+        "_ret_type",
+        "_day_or",
+        "_implement_cron_bug",
+        "second_at_beginning",
+        "_expand_from_start_time",
+        "_max_years_btw_matches_explicitly_set",
+        "_max_years_between_matches",
+        "tzinfo",
+        "start_time",
+        "dst_start_time",
+        "cur",
+        "expanded",
+        "_expanded_desc",
+        "_scratch_expanded",
+        "_fixed_period",
+        "nth_weekday_of_month",
+        "fields",
+        "expressions",
+        "_is_prev",
+    )
+
     MONTHS_IN_YEAR = 12
 
     # This helps with expanding `*` fields into `lower-upper` ranges. Each item
@@ -331,6 +377,13 @@ class croniter:
             ),
             second_at_beginning=second_at_beginning,
         )
+        # Descending views of each field, consumed as-is by _get_prev_nearest_diff
+        self._expanded_desc = tuple(tuple(reversed(v)) for v in self.expanded)
+        # Working copy for the day-of-month/day-of-week union in _calc_next
+        self._scratch_expanded = self.expanded[:]
+        self._fixed_period = self._get_fixed_period(
+            self.expanded, self.nth_weekday_of_month
+        )
         self.fields = CRON_FIELDS[len(self.expanded)]
         self.expressions = EXPRESSIONS[(expr_format, hash_id, second_at_beginning)]
         self._is_prev = is_prev
@@ -435,8 +488,14 @@ class croniter:
                 "Invalid ret_type, only 'float' or 'datetime' is acceptable."
             )
 
-        result = self._calc_next(is_prev)
-        timestamp = self.datetime_to_timestamp(result)
+        if self._fixed_period is None or self.tzinfo is not None:
+            result = self._calc_next(is_prev)
+            timestamp = self.datetime_to_timestamp(result)
+        else:
+            # Without a timezone there is no DST: plain arithmetic on the timestamp
+            timestamp = self._calc_fixed_period_next(is_prev)
+            if issubclass(ret_type, datetime.datetime):
+                result = self.timestamp_to_datetime(timestamp)
         if update_current:
             self.cur = timestamp
         if issubclass(ret_type, datetime.datetime):
@@ -498,8 +557,8 @@ class croniter:
 
     def _calc_next(self, is_prev: bool) -> datetime.datetime:
         current = self.timestamp_to_datetime(self.cur)
-        expanded = self.expanded[:]
-        nth_weekday_of_month = self.nth_weekday_of_month.copy()
+        expanded = self.expanded
+        nth_weekday_of_month = self.nth_weekday_of_month
 
         # exception to support day of month and day of week as defined in cron
         if (
@@ -517,13 +576,16 @@ class croniter:
                 # does an intersect instead
                 pass
             else:
-                bak = expanded[DOW_FIELD]
-                expanded[DOW_FIELD] = ["*"]
-                t1 = self._calc(current, expanded, nth_weekday_of_month, is_prev)
-                expanded[DOW_FIELD] = bak
-                expanded[DAY_FIELD] = ["*"]
-
-                t2 = self._calc(current, expanded, nth_weekday_of_month, is_prev)
+                # Both fields are reassigned on every entry, so the scratch list
+                # needs no restoring even if _calc raises in between
+                scratch = self._scratch_expanded
+                scratch[DAY_FIELD] = expanded[DAY_FIELD]
+                scratch[DOW_FIELD] = ["*"]
+                t1 = self._calc(current, scratch, nth_weekday_of_month, is_prev)
+                scratch[DOW_FIELD] = expanded[DOW_FIELD]
+                scratch[DAY_FIELD] = ["*"]
+
+                t2 = self._calc(current, scratch, nth_weekday_of_month, is_prev)
                 if is_prev:
                     return t1 if t1 > t2 else t2
                 return t1 if t1 < t2 else t2
@@ -537,21 +599,27 @@ class croniter:
         nth_weekday_of_month: dict[int, set[int]],
         is_prev: bool,
     ) -> datetime.datetime:
+        # Fields replaced by ["*"] in `expanded` are never searched, so the
+        # precomputed descending views stay valid for the prev direction
         if is_prev:
             nearest_diff_method = self._get_prev_nearest_diff
-            offset = relativedelta(microseconds=-1)
+            to_check = self._expanded_desc
+            offset = ONE_MICROSECOND_BACK
         else:
             nearest_diff_method = self._get_next_nearest_diff
+            to_check = expanded
             if len(expanded) > UNIX_CRON_LEN:
-                offset = relativedelta(seconds=1)
+                offset = ONE_SECOND
             else:
-                offset = relativedelta(minutes=1)
+                offset = ONE_MINUTE
         # Calculate the next cron time in local time a.k.a. timezone unaware time.
-        unaware_time = now.replace(tzinfo=None) + offset
+        # Aware + timedelta is wall-clock arithmetic, so the tzinfo can be dropped
+        # in the same replace() that truncates the sub-unit fields.
+        unaware_time = now + offset
         if len(expanded) > UNIX_CRON_LEN:
-            unaware_time = unaware_time.replace(microsecond=0)
+            unaware_time = unaware_time.replace(tzinfo=None, microsecond=0)
         else:
-            unaware_time = unaware_time.replace(second=0, microsecond=0)
+            unaware_time = unaware_time.replace(tzinfo=None, second=0, microsecond=0)
 
         month = unaware_time.month
         year = current_year = unaware_time.year
@@ -562,7 +630,7 @@ class croniter:
                     expanded[YEAR_FIELD].index("*")
                 except ValueError:
                     # use None as range_val to indicate no loop
-                    diff_year = nearest_diff_method(d.year, expanded[YEAR_FIELD], None)
+                    diff_year = nearest_diff_method(d.year, to_check[YEAR_FIELD], None)
                     if diff_year is None:
                         return None, d
                     if diff_year != 0:
@@ -592,7 +660,7 @@ class croniter:
                 expanded[MONTH_FIELD].index("*")
             except ValueError:
                 diff_month = nearest_diff_method(
-                    d.month, expanded[MONTH_FIELD], self.MONTHS_IN_YEAR
+                    d.month, to_check[MONTH_FIELD], self.MONTHS_IN_YEAR
                 )
                 reset_day = 1
 
@@ -619,10 +687,10 @@ class croniter:
                 if is_prev:
                     days_in_prev_month = DAYS[(month - 2) % self.MONTHS_IN_YEAR]
                     diff_day = nearest_diff_method(
-                        d.day, expanded[DAY_FIELD], days_in_prev_month
+                        d.day, to_check[DAY_FIELD], days_in_prev_month
                     )
                 else:
-                    diff_day = nearest_diff_method(d.day, expanded[DAY_FIELD], days)
+                    diff_day = nearest_diff_method(d.day, to_check[DAY_FIELD], days)
 
                 if diff_day is not None and diff_day != 0:
                     if is_prev:
@@ -637,7 +705,7 @@ class croniter:
                 expanded[DOW_FIELD].index("*")
             except ValueError:
                 diff_day_of_week = nearest_diff_method(
-                    d.isoweekday() % 7, expanded[DOW_FIELD], 7
+                    d.isoweekday() % 7, to_check[DOW_FIELD], 7
                 )
                 if diff_day_of_week is not None and diff_day_of_week != 0:
                     if is_prev:
@@ -652,15 +720,6 @@ class croniter:
             return False, d
 
         def proc_day_of_week_nth(d):
-            if "*" in nth_weekday_of_month:
-                s = nth_weekday_of_month["*"]
-                for i in range(0, 7):
-                    if i in nth_weekday_of_month:
-                        nth_weekday_of_month[i].update(s)
-                    else:
-                        nth_weekday_of_month[i] = s
-                del nth_weekday_of_month["*"]
-
             candidates = []
             for wday, nth in nth_weekday_of_month.items():
                 c = self._get_nth_weekday_of_month(d.year, d.month, wday)
@@ -700,7 +759,7 @@ class croniter:
             try:
                 expanded[HOUR_FIELD].index("*")
             except ValueError:
-                diff_hour = nearest_diff_method(d.hour, expanded[HOUR_FIELD], 24)
+                diff_hour = nearest_diff_method(d.hour, to_check[HOUR_FIELD], 24)
                 if diff_hour is not None and diff_hour != 0:
                     if is_prev:
                         d += relativedelta(hours=diff_hour, minute=59, second=59)
@@ -713,7 +772,7 @@ class croniter:
             try:
                 expanded[MINUTE_FIELD].index("*")
             except ValueError:
-                diff_min = nearest_diff_method(d.minute, expanded[MINUTE_FIELD], 60)
+                diff_min = nearest_diff_method(d.minute, to_check[MINUTE_FIELD], 60)
                 if diff_min is not None and diff_min != 0:
                     if is_prev:
                         d += relativedelta(minutes=diff_min, second=59)
@@ -727,7 +786,7 @@ class croniter:
                 try:
                     expanded[SECOND_FIELD].index("*")
                 except ValueError:
-                    diff_sec = nearest_diff_method(d.second, expanded[SECOND_FIELD], 60)
+                    diff_sec = nearest_diff_method(d.second, to_check[SECOND_FIELD], 60)
                     if diff_sec is not None and diff_sec != 0:
                         d += relativedelta(seconds=diff_sec)
                         return True, d
@@ -812,6 +871,70 @@ class croniter:
             raise CroniterBadDateError("failed to find prev date")
         raise CroniterBadDateError("failed to find next date")
 
+    def _calc_fixed_period_next(self, is_prev: bool) -> float:
+        """Next (or previous) match strictly after (or before) `self.cur`,
+        for expressions detected by `_get_fixed_period`."""
+        period, phase = self._fixed_period
+        if is_prev:
+            return float(phase + (-((phase - self.cur) // period) - 1) * period)
+        return float(phase + ((self.cur - phase) // period + 1) * period)
+
+    @classmethod
+    def _get_fixed_period(
+        cls, expanded: list[ExpandedExpression], nth_weekday_of_month: dict
+    ) -> Optional[tuple[int, int]]:
+        """
+        Return `(period, phase)` in seconds when the expression matches at a
+        fixed interval (e.g. `*/15 * * * *`, `0 */2 * * *` or `30 2 * * *`),
+        None otherwise.
+
+        Calendar fields must all be wildcards: month lengths vary, so
+        `0 0 */3 * *` is not periodic.
+        """
+        if nth_weekday_of_month:
+            return None
+        calendar_fields = [DAY_FIELD, MONTH_FIELD, DOW_FIELD]
+        if len(expanded) == YEAR_CRON_LEN:
+            calendar_fields.append(YEAR_FIELD)
+        if any(expanded[field] != ["*"] for field in calendar_fields):
+            return None
+
+        # Time fields from the finest to the coarsest, with their unit in seconds.
+        # Classic 5 fields expressions always fire at second 0.
+        time_fields = [(MINUTE_FIELD, 60), (HOUR_FIELD, 3600)]
+        if len(expanded) > UNIX_CRON_LEN:
+            time_fields.insert(0, (SECOND_FIELD, 1))
+
+        # Finer fields pinned to a single value only shift the phase; the first
+        # field with several values sets the period, and every coarser field
+        # must then be a wildcard.
+        phase = 0
+        for position, (field, unit) in enumerate(time_fields):
+            low, high = cls.RANGES[field]
+            values = expanded[field]
+            if values == ["*"]:
+                first, step = low, 1
+            elif "*" in values:
+                # e.g. `*,5`: a wildcard mixed with values is not expanded
+                return None
+            elif len(values) == 1:
+                phase += (values[0] - low) * unit
+                continue
+            else:
+                first, step = values[0], values[1] - values[0]
+                if (
+                    (high - low + 1) % step
+                    or first - low >= step
+                    or values != list(range(first, high + 1, step))
+                ):
+                    return None
+            if any(expanded[f] != ["*"] for f, _ in time_fields[position + 1 :]):
+                return None
+            return step * unit, phase + (first - low) * unit
+
+        # Every time field is pinned: once a day
+        return 86400, phase
+
     @staticmethod
     def _get_next_nearest_diff(x, to_check, range_val):
         """
@@ -839,24 +962,23 @@ class croniter:
     @staticmethod
     def _get_prev_nearest_diff(x, to_check, range_val):
         """
+        `to_check` holds the field values in descending order.
         `range_val` is the range of a field.
         If no available time, we can move to previous loop(like previous month).
         Range_val can also be set to `None` to indicate that there is no loop.
         ( Currently should only used for `year` field )
         """
-        candidates = to_check[:]
-        candidates.reverse()
-        for d in candidates:
+        for d in to_check:
             if d != "l" and d <= x:
                 return d - x
-        if "l" in candidates:
+        if "l" in to_check:
             return -x
         # When range_val is None and x not exists in to_check,
         # `None` will be returned to suggest no more available time
         if range_val is None:
             return None
-        candidate = candidates[0]
-        for c in candidates:
+        candidate = to_check[0]
+        for c in to_check:
             # fixed: c < range_val
             # this code will reject all 31 day of month, 12 month, 59 second,
             # 23 hour and so on.
@@ -873,6 +995,7 @@ class croniter:
         return candidate - x - range_val
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _get_nth_weekday_of_month(
         year: int, month: int, day_of_week: int
     ) -> tuple[int, ...]:
@@ -880,7 +1003,7 @@ class croniter:
         The last weekday of the month is always [-1].
         """
         w = (day_of_week + 6) % 7
-        c = calendar.Calendar(w).monthdayscalendar(year, month)
+        c = CALENDARS[w].monthdayscalendar(year, month)
         if c[0][0] == 0:
             c.pop(0)
         return tuple(i[0] for i in c)
@@ -889,6 +1012,11 @@ class croniter:
     def value_alias(cls, val, field_index, len_expressions=UNIX_CRON_LEN):
         if isinstance(len_expressions, (list, dict, tuple, set)):
             len_expressions = len(len_expressions)
+        return cls._value_alias_fast(val, field_index, len_expressions)
+
+    @classmethod
+    def _value_alias_fast(cls, val, field_index, len_expressions):
+        # value_alias without the container check: len_expressions is an int
         if val in cls.LOWMAP[field_index] and not (
             # do not support 0 as a month either for classical 5 fields cron,
             # 6fields second repeat form or 7 fields year form
@@ -912,6 +1040,35 @@ class croniter:
     @classmethod
     def _expand(
         cls, expr_format, hash_id=None, second_at_beginning=False, from_timestamp=None
+    ):
+        # Expansion is deterministic unless it depends on the start time or draws
+        # random ("R") values: only that deterministic case is cached.
+        if from_timestamp is None and not any(
+            field.startswith("r") for field in expr_format.lower().split()
+        ):
+            expanded, nth_weekday_of_month, expressions = cls._expand_cached(
+                expr_format, hash_id, second_at_beginning
+            )
+            # Hand out copies so that callers cannot alter the cached entry
+            expanded = [field[:] for field in expanded]
+            nth_weekday_of_month = {
+                key: set(value) for key, value in nth_weekday_of_month.items()
+            }
+        else:
+            expanded, nth_weekday_of_month, expressions = cls._expand_expression(
+                expr_format, hash_id, second_at_beginning, from_timestamp
+            )
+        _remember_expressions((expr_format, hash_id, second_at_beginning), expressions)
+        return expanded, nth_weekday_of_month
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _expand_cached(cls, expr_format, hash_id, second_at_beginning):
+        return cls._expand_expression(expr_format, hash_id, second_at_beginning)
+
+    @classmethod
+    def _expand_expression(
+        cls, expr_format, hash_id=None, second_at_beginning=False, from_timestamp=None
     ):
         # Split the expression in components, and normalize L -> l, MON -> mon,
         # etc. Keep expr_format untouched so we can use it in the exception
@@ -944,231 +1101,328 @@ class croniter:
             # move second to it's own(6th) field to process by same logical
             expressions.insert(SECOND_FIELD, expressions.pop(0))
 
-        expanded = []
+        len_expressions = len(expressions)
+        expanded = [None] * len_expressions
         nth_weekday_of_month = {}
+        expanders = [expander(cls) for expander in EXPANDERS.values()]
 
         for field_index, expr in enumerate(expressions):
-            for expanderid, expander in EXPANDERS.items():
-                expr = expander(cls).expand(
-                    efl,
-                    field_index,
-                    expr,
-                    hash_id=hash_id,
-                    from_timestamp=from_timestamp,
-                )
-
-            if "?" in expr:
-                if expr != "?":
-                    raise CroniterBadCronError(
-                        f"[{expr_format}] is not acceptable."
-                        f" Question mark can not used with other characters"
+            if from_timestamp is None:
+                res = cls._expand_simple_field(field_index, expr)
+                if res is not None:
+                    expanded[field_index] = cls._collapse_field(
+                        field_index, res, expressions
                     )
-                if field_index not in [DAY_FIELD, DOW_FIELD]:
-                    raise CroniterBadCronError(
-                        f"[{expr_format}] is not acceptable. "
-                        f"Question mark can only used in day_of_month or day_of_week"
-                    )
-                # currently just trade `?` as `*`
-                expr = "*"
-
-            e_list = expr.split(",")
-            res = []
-
-            while len(e_list) > 0:
-                e = e_list.pop()
-                nth = None
-
-                if field_index == DOW_FIELD:
-                    # Handle special case in the dow expression: 2#3, l3
-                    special_dow_rem = special_dow_re.match(str(e))
-                    if special_dow_rem:
-                        g = special_dow_rem.groupdict()
-                        he, last = g.get("he", ""), g.get("last", "")
-                        if he:
-                            e = he
-                            try:
-                                nth = int(last)
-                                assert 5 >= nth >= 1
-                            except (KeyError, ValueError, AssertionError):
-                                raise CroniterBadCronError(
-                                    f"[{expr_format}] is not acceptable."
-                                    f" Invalid day_of_week value: '{nth}'"
-                                )
-                        elif last:
-                            e = last
-                            nth = g["pre"]  # 'l'
-
-                # Before matching step_search_re, normalize "*" to "{min}-{max}".
-                # Example: in the minute field, "*/5" normalizes to "0-59/5"
-                t = re.sub(
-                    r"^\*(\/.+)$",
-                    r"%d-%d\1"
-                    % (cls.RANGES[field_index][0], cls.RANGES[field_index][1]),
-                    str(e),
+                    continue
+
+            res = cls._expand_field(
+                field_index,
+                expr,
+                efl,
+                expr_format,
+                expressions,
+                len_expressions,
+                expanders,
+                nth_weekday_of_month,
+                hash_id,
+                from_timestamp,
+            )
+            expanded[field_index] = cls._collapse_field(field_index, res, expressions)
+
+        # Check to make sure the dow combo in use is supported
+        if nth_weekday_of_month:
+            dow_expanded_set = set(expanded[DOW_FIELD])
+            dow_expanded_set = dow_expanded_set.difference(nth_weekday_of_month.keys())
+            dow_expanded_set.discard("*")
+            # Skip: if it's all weeks instead of wildcard
+            if (
+                dow_expanded_set
+                and len(set(expanded[DOW_FIELD])) != cls.LEN_MEANS_ALL[DOW_FIELD]
+            ):
+                raise CroniterUnsupportedSyntaxError(
+                    f"day-of-week field does not support mixing literal values and nth"
+                    f" day of week syntax.  Cron: '{expr_format}'"
+                    f"    dow={dow_expanded_set} vs nth={nth_weekday_of_month}"
                 )
-                m = step_search_re.search(t)
 
-                if not m:
-                    # Before matching step_search_re,
-                    # normalize "{start}/{step}" to "{start}-{max}/{step}".
-                    # Example: in the minute field, "10/5" normalizes to "10-59/5"
-                    t = re.sub(
-                        r"^(.+)\/(.+)$",
-                        r"\1-%d/\2" % (cls.RANGES[field_index][1]),
-                        str(e),
-                    )
-                    m = step_search_re.search(t)
+        # Spread a wildcard nth entry over every weekday once, so the mapping
+        # can be shared read-only by all later _calc calls
+        if "*" in nth_weekday_of_month:
+            s = nth_weekday_of_month.pop("*")
+            for i in range(0, 7):
+                nth_weekday_of_month.setdefault(i, set()).update(s)
 
-                if m:
-                    # early abort if low/high are out of bounds
-                    low, high, step = m.group(1), m.group(2), m.group(4) or 1
-                    if field_index == DAY_FIELD and high == "l":
-                        high = "31"
+        return expanded, nth_weekday_of_month, expressions
 
-                    if not only_int_re.search(low):
-                        low = str(cls._alphaconv(field_index, low, expressions))
+    @classmethod
+    def _expand_field(
+        cls,
+        field_index,
+        expr,
+        efl,
+        expr_format,
+        expressions,
+        len_expressions,
+        expanders,
+        nth_weekday_of_month,
+        hash_id=None,
+        from_timestamp=None,
+    ):
+        """Expand one field of a cron expression into its sorted values.
 
-                    if not only_int_re.search(high):
-                        high = str(cls._alphaconv(field_index, high, expressions))
+        Self-contained hot path of _expand_expression: nth weekday items are
+        recorded into nth_weekday_of_month as a side effect.
+        """
+        range_low, range_high = cls.RANGES[field_index]
 
-                    # normally, it's already guarded by the RE that should not accept
-                    # not-int values.
-                    if not only_int_re.search(str(step)):
-                        raise CroniterBadCronError(
-                            f"[{expr_format}] step '{step}'"
-                            f" in field {field_index} is not acceptable"
-                        )
-                    step = int(step)
+        for expander in expanders:
+            expr = expander.expand(
+                efl,
+                field_index,
+                expr,
+                hash_id=hash_id,
+                from_timestamp=from_timestamp,
+            )
 
-                    for band in low, high:
-                        if not only_int_re.search(str(band)):
+        if "?" in expr:
+            if expr != "?":
+                raise CroniterBadCronError(
+                    f"[{expr_format}] is not acceptable."
+                    f" Question mark can not used with other characters"
+                )
+            if field_index not in [DAY_FIELD, DOW_FIELD]:
+                raise CroniterBadCronError(
+                    f"[{expr_format}] is not acceptable. "
+                    f"Question mark can only used in day_of_month or day_of_week"
+                )
+            # currently just trade `?` as `*`
+            expr = "*"
+
+        e_list = expr.split(",")
+        # Everything ever queued: re-expanding a value would be a no-op
+        queued = set(e_list)
+        res = set()
+
+        while len(e_list) > 0:
+            e = e_list.pop()
+            nth = None
+
+            if field_index == DOW_FIELD:
+                # Handle special case in the dow expression: 2#3, l3
+                # (only items holding a "#" or starting with "l" can match)
+                special_dow_rem = None
+                e_str = str(e)
+                if "#" in e_str or e_str.startswith("l"):
+                    special_dow_rem = special_dow_re.match(e_str)
+                if special_dow_rem:
+                    g = special_dow_rem.groupdict()
+                    he, last = g.get("he", ""), g.get("last", "")
+                    if he:
+                        e = he
+                        try:
+                            nth = int(last)
+                            assert 5 >= nth >= 1
+                        except (KeyError, ValueError, AssertionError):
                             raise CroniterBadCronError(
-                                f"[{expr_format}] bands '{low}-{high}'"
-                                f" in field {field_index} are not acceptable"
+                                f"[{expr_format}] is not acceptable."
+                                f" Invalid day_of_week value: '{nth}'"
                             )
+                    elif last:
+                        e = last
+                        nth = g["pre"]  # 'l'
+
+            # Before matching step_search_re, normalize "*" to "{min}-{max}".
+            # Example: in the minute field, "*/5" normalizes to "0-59/5"
+            t = str(e)
+            if len(t) > 2 and t.startswith("*/"):
+                t = f"{range_low}-{range_high}{t[1:]}"
+            m = step_search_re.search(t)
+
+            if not m:
+                # Before matching step_search_re,
+                # normalize "{start}/{step}" to "{start}-{max}/{step}".
+                # Example: in the minute field, "10/5" normalizes to "10-59/5"
+                t = str(e)
+                # last "/" with something on both sides of it
+                slash = t.rfind("/", 1, len(t) - 1)
+                if slash != -1:
+                    t = f"{t[:slash]}-{range_high}{t[slash:]}"
+                m = step_search_re.search(t)
 
-                    low, high = (
-                        cls.value_alias(int(_val), field_index, expressions)
-                        for _val in (low, high)
-                    )
+            if m:
+                # early abort if low/high are out of bounds
+                low, high, step = m.group(1), m.group(2), m.group(4) or 1
+                if field_index == DAY_FIELD and high == "l":
+                    high = "31"
 
-                    if max(low, high) > max(
-                        cls.RANGES[field_index][0], cls.RANGES[field_index][1]
-                    ):
-                        raise CroniterBadCronError(f"{expr_format} is out of bands")
+                if not only_int_re.search(low):
+                    low = str(cls._alphaconv(field_index, low, expressions))
 
-                    if from_timestamp:
-                        low = cls._get_low_from_current_date_number(
-                            field_index, int(step), int(from_timestamp)
-                        )
+                if not only_int_re.search(high):
+                    high = str(cls._alphaconv(field_index, high, expressions))
 
-                    # Handle when the second bound of the range is in backtracking order:
-                    # eg: X-Sun or X-7 (Sat-Sun) in DOW, or X-Jan (Apr-Jan) in MONTH
-                    if low > high:
-                        whole_field_range = list(
-                            range(
-                                cls.RANGES[field_index][0],
-                                cls.RANGES[field_index][1] + 1,
-                                1,
-                            )
-                        )
-                        # Add FirstBound -> ENDRANGE, respecting step
-                        rng = list(range(low, cls.RANGES[field_index][1] + 1, step))
-                        # Then 0 -> SecondBound, but skipping n first occurences according to step
-                        # EG to respect such expressions : Apr-Jan/3
-                        to_skip = 0
-                        if rng:
-                            already_skipped = list(reversed(whole_field_range)).index(
-                                rng[-1]
-                            )
-                            curpos = whole_field_range.index(rng[-1])
-                            if ((curpos + step) > len(whole_field_range)) and (
-                                already_skipped < step
-                            ):
-                                to_skip = step - already_skipped
-                        rng += list(
-                            range(cls.RANGES[field_index][0] + to_skip, high + 1, step)
-                        )
-                    # if we include a range type: Jan-Jan, or Sun-Sun,
-                    #  it means the whole cycle (all days of week, # all monthes of year, etc)
-                    elif low == high:
-                        rng = list(
-                            range(
-                                cls.RANGES[field_index][0],
-                                cls.RANGES[field_index][1] + 1,
-                                step,
-                            )
-                        )
-                    else:
-                        try:
-                            rng = list(range(low, high + 1, step))
-                        except ValueError as exc:
-                            raise CroniterBadCronError(f"invalid range: {exc}")
+                # normally, it's already guarded by the RE that should not accept
+                # not-int values.
+                if not only_int_re.search(str(step)):
+                    raise CroniterBadCronError(
+                        f"[{expr_format}] step '{step}'"
+                        f" in field {field_index} is not acceptable"
+                    )
+                step = int(step)
 
-                    if field_index == DOW_FIELD and nth and nth != "l":
-                        rng = [f"{item}#{nth}" for item in rng]
-                    e_list += [a for a in rng if a not in e_list]
-                else:
-                    if t.startswith("-"):
+                for band in low, high:
+                    if not only_int_re.search(str(band)):
                         raise CroniterBadCronError(
-                            f"[{expr_format}] is not acceptable, negative numbers not allowed"
+                            f"[{expr_format}] bands '{low}-{high}'"
+                            f" in field {field_index} are not acceptable"
                         )
-                    if not star_or_int_re.search(t):
-                        t = cls._alphaconv(field_index, t, expressions)
 
+                low, high = (
+                    cls._value_alias_fast(int(_val), field_index, len_expressions)
+                    for _val in (low, high)
+                )
+
+                if max(low, high) > max(range_low, range_high):
+                    raise CroniterBadCronError(f"{expr_format} is out of bands")
+
+                if from_timestamp:
+                    low = cls._get_low_from_current_date_number(
+                        field_index, int(step), int(from_timestamp)
+                    )
+
+                # Handle when the second bound of the range is in backtracking order:
+                # eg: X-Sun or X-7 (Sat-Sun) in DOW, or X-Jan (Apr-Jan) in MONTH
+                if low > high:
+                    # Add FirstBound -> ENDRANGE, respecting step
+                    rng = list(range(low, range_high + 1, step))
+                    # Then 0 -> SecondBound, but skipping n first occurences according to step
+                    # EG to respect such expressions : Apr-Jan/3
+                    to_skip = 0
+                    if rng:
+                        # Positions of the last value within range_low..range_high,
+                        # counted from the end and from the start
+                        already_skipped = range_high - rng[-1]
+                        curpos = rng[-1] - range_low
+                        if (curpos + step) > (range_high - range_low + 1) and (
+                            already_skipped < step
+                        ):
+                            to_skip = step - already_skipped
+                    rng += list(range(range_low + to_skip, high + 1, step))
+                # if we include a range type: Jan-Jan, or Sun-Sun,
+                #  it means the whole cycle (all days of week, # all monthes of year, etc)
+                elif low == high:
+                    rng = list(range(range_low, range_high + 1, step))
+                else:
                     try:
-                        t = int(t)
-                    except ValueError:
-                        pass
+                        rng = list(range(low, high + 1, step))
+                    except ValueError as exc:
+                        raise CroniterBadCronError(f"invalid range: {exc}")
+
+                if field_index == DOW_FIELD and nth and nth != "l":
+                    rng = [f"{item}#{nth}" for item in rng]
+                for a in rng:
+                    if a not in queued:
+                        queued.add(a)
+                        e_list.append(a)
+            else:
+                if t.startswith("-"):
+                    raise CroniterBadCronError(
+                        f"[{expr_format}] is not acceptable, negative numbers not allowed"
+                    )
+                if not star_or_int_re.search(t):
+                    t = cls._alphaconv(field_index, t, expressions)
 
-                    t = cls.value_alias(t, field_index, expressions)
+                try:
+                    t = int(t)
+                except ValueError:
+                    pass
 
-                    if t not in ["*", "l"] and (
-                        int(t) < cls.RANGES[field_index][0]
-                        or int(t) > cls.RANGES[field_index][1]
-                    ):
-                        raise CroniterBadCronError(
-                            f"[{expr_format}] is not acceptable, out of range"
-                        )
+                t = cls._value_alias_fast(t, field_index, len_expressions)
 
-                    res.append(t)
+                if t not in ["*", "l"] and (int(t) < range_low or int(t) > range_high):
+                    raise CroniterBadCronError(
+                        f"[{expr_format}] is not acceptable, out of range"
+                    )
 
-                    if field_index == DOW_FIELD and nth:
-                        if t not in nth_weekday_of_month:
-                            nth_weekday_of_month[t] = set()
-                        nth_weekday_of_month[t].add(nth)
+                res.add(t)
 
-            res = set(res)
-            res = sorted(res, key=lambda i: f"{i:02}" if isinstance(i, int) else i)
-            if len(res) == cls.LEN_MEANS_ALL[field_index]:
-                # Make sure the wildcard is used in the correct way (avoid over-optimization)
-                if (field_index == DAY_FIELD and "*" not in expressions[DOW_FIELD]) or (
-                    field_index == DOW_FIELD and "*" not in expressions[DAY_FIELD]
-                ):
-                    pass
-                else:
-                    res = ["*"]
+                if field_index == DOW_FIELD and nth:
+                    if t not in nth_weekday_of_month:
+                        nth_weekday_of_month[t] = set()
+                    nth_weekday_of_month[t].add(nth)
 
-            expanded.append(["*"] if (len(res) == 1 and res[0] == "*") else res)
+        # Numbers in ascending order, with "*" before them and "l" after them
+        ints = sorted(i for i in res if isinstance(i, int))
+        res = (["*"] if "*" in res else []) + ints + (["l"] if "l" in res else [])
+        return res
+
+    @classmethod
+    def _expand_simple_field(cls, field_index, expr):
+        """
+        Expand a field only made of integers, `*`, `*/step`, `low-high` and
+        `low-high/step` items, without going through the expanders and regexes.
+
+        Return the sorted values, or None when the field needs the generic path
+        (names, hashes, `l`, `#`, `?`, aliased or out of range values, backward
+        ranges...), which also takes care of reporting errors.
+        """
+        if expr == "*":
+            return ["*"]
+        if not SIMPLE_FIELD_CHARS.issuperset(expr):
+            return None
+
+        range_low, range_high = cls.RANGES[field_index]
+        aliases = cls.LOWMAP[field_index]
+        values = set()
+        for item in expr.split(","):
+            bounds, slash, step = item.partition("/")
+            if slash:
+                if not step.isdigit() or not int(step):
+                    return None
+                step = int(step)
+            else:
+                step = 1
+
+            if bounds == "*":
+                # a bare `*` mixed with other items is kept as-is by the generic path
+                if not slash:
+                    return None
+                low, high = range_low, range_high
+            elif "-" in bounds:
+                low, _, high = bounds.partition("-")
+                if not (low.isdigit() and high.isdigit()):
+                    return None
+                low, high = int(low), int(high)
+                if low >= high:
+                    return None
+            elif slash or not bounds.isdigit():
+                return None
+            else:
+                low = high = int(bounds)
 
-        # Check to make sure the dow combo in use is supported
-        if nth_weekday_of_month:
-            dow_expanded_set = set(expanded[DOW_FIELD])
-            dow_expanded_set = dow_expanded_set.difference(nth_weekday_of_month.keys())
-            dow_expanded_set.discard("*")
-            # Skip: if it's all weeks instead of wildcard
             if (
-                dow_expanded_set
-                and len(set(expanded[DOW_FIELD])) != cls.LEN_MEANS_ALL[DOW_FIELD]
+                low < range_low
+                or high > range_high
+                or low in aliases
+                or high in aliases
             ):
-                raise CroniterUnsupportedSyntaxError(
-                    f"day-of-week field does not support mixing literal values and nth"
-                    f" day of week syntax.  Cron: '{expr_format}'"
-                    f"    dow={dow_expanded_set} vs nth={nth_weekday_of_month}"
-                )
+                return None
+            values.update(range(low, high + 1, step))
+        return sorted(values)
 
-        EXPRESSIONS[(expr_format, hash_id, second_at_beginning)] = expressions
-        return expanded, nth_weekday_of_month
+    @classmethod
+    def _collapse_field(cls, field_index, res, expressions):
+        """Collapse the sorted values of a field to `["*"]` when they cover it all."""
+        if len(res) == cls.LEN_MEANS_ALL[field_index]:
+            # Make sure the wildcard is used in the correct way (avoid over-optimization)
+            if (field_index == DAY_FIELD and "*" not in expressions[DOW_FIELD]) or (
+                field_index == DOW_FIELD and "*" not in expressions[DAY_FIELD]
+            ):
+                pass
+            else:
+                res = ["*"]
+
+        return ["*"] if (len(res) == 1 and res[0] == "*") else res
 
     @classmethod
     def expand(
@@ -1366,6 +1620,18 @@ def croniter_range(
             return v > stop
 
         step = ic.get_prev
+    if ic._fixed_period is not None and ic.tzinfo is None:
+        # Matches form an arithmetic progression: step the timestamp directly
+        period = ic._fixed_period[0] if start < stop else -ic._fixed_period[0]
+        stop_ts = ic.datetime_to_timestamp(stop)
+        ts = step(float)
+        while ts < stop_ts if period > 0 else ts > stop_ts:
+            if ret_type is float:
+                yield ts
+            else:
+                yield ic.timestamp_to_datetime(ts)
+            ts += period
+        return
     try:
         dt = step()
         while cont(dt):
@@ -1382,6 +1648,8 @@ def croniter_range(
 class HashExpander:
     def __init__(self, cronit):
         self.cron = cronit
+        # One expander serves every field of an expansion: hash each id once
+        self._crc_cache = {}
 
     def do(self, idx, hash_type="h", hash_id=None, range_end=None, range_begin=None):
         """Return a hashed/random integer given range/hash information"""
@@ -1392,7 +1660,10 @@ class HashExpander:
         if hash_type == "r":
             crc = random.randint(0, 0xFFFFFFFF)
         else:
-            crc = binascii.crc32(hash_id) & 0xFFFFFFFF
+            crc = self._crc_cache.get(hash_id)
+            if crc is None:
+                crc = binascii.crc32(hash_id) & 0xFFFFFFFF
+                self._crc_cache[hash_id] = crc
         return ((crc >> idx) % (range_end - range_begin + 1)) + range_begin
 
     def match(self, efl, idx, expr, hash_id=None, **kw):
@@ -1401,6 +1672,9 @@ class HashExpander:
     def expand(self, efl, idx, expr, hash_id=None, match="", **kw):
         """Expand a hashed/random expression to its normal representation"""
         if match == "":
+            # Hashed/random items always start with their type letter
+            if not expr.startswith(("h", "r")):
+                return expr
             match = self.match(efl, idx, expr, hash_id, **kw)
         if not match:
             return expr
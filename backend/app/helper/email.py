@@ -1,5 +1,9 @@
 import os
+import queue
 import smtplib
+import threading
+import time
+from collections.abc import Iterable
 from email.mime.text import MIMEText
 
 from dotenv import load_dotenv
@@ -13,38 +17,172 @@ SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "false").lower() == "true"
 SMTP_USE_SSL: bool = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
 SMTP_USER: str | None = os.getenv("SMTP_USER")
 SMTP_PASSWORD: str | None = os.getenv("SMTP_PASSWORD")
+# Durée (en secondes) au-delà de laquelle une connexion inutilisée est renouvelée
+SMTP_IDLE_TIMEOUT: float = float(os.getenv("SMTP_IDLE_TIMEOUT", "60"))
 EMAIL_FROM: str = os.getenv("EMAIL_FROM", "noreply@windflow.local")
 VITE_BASE_URL: str = os.getenv("VITE_BASE_URL", "http://localhost:5173")
 
+# Paramètres de connexion dérivés une fois pour toutes de la configuration
+_SERVER_CLASS: type[smtplib.SMTP] = smtplib.SMTP_SSL if SMTP_USE_SSL else smtplib.SMTP
+_NEEDS_STARTTLS: bool = SMTP_USE_TLS and not SMTP_USE_SSL
+_HAS_AUTH: bool = bool(SMTP_USER and SMTP_PASSWORD)
 
-def send_email(to_email: str, subject: str, body: str, subtype: str = "plain"):
-    """Méthode générique pour envoyer des emails"""
 
-    # Création du message MIME
+class _SMTPPool:
+    """Connexion SMTP conservée par thread et réutilisée entre les envois.
+
+    Évite une poignée de main TLS et une authentification par email ; la
+    connexion est renouvelée lorsqu'elle est restée inutilisée trop longtemps.
+    """
+
+    def __init__(self, idle_timeout: float = SMTP_IDLE_TIMEOUT):
+        self._local = threading.local()
+        self._idle_timeout = idle_timeout
+
+    @staticmethod
+    def _connect() -> smtplib.SMTP:
+        server = _SERVER_CLASS(SMTP_SERVER, SMTP_PORT)
+
+        # Démarrage TLS si configuré (uniquement pour les connexions non-SSL)
+        if _NEEDS_STARTTLS:
+            server.starttls()
+
+        # Authentification si les identifiants sont fournis
+        if _HAS_AUTH:
+            server.login(SMTP_USER, SMTP_PASSWORD)
+        return server
+
+    def get(self) -> smtplib.SMTP:
+        """Retourne la connexion du thread courant, en l'ouvrant si nécessaire"""
+        conn = getattr(self._local, "conn", None)
+        if (
+            conn is not None
+            and time.monotonic() - self._local.last_used > self._idle_timeout
+        ):
+            # Les serveurs coupent les sessions inactives : on repart d'une connexion neuve
+            self.close()
+            conn = None
+
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        self._local.last_used = time.monotonic()
+        return conn
+
+    def close(self):
+        """Ferme la connexion du thread courant"""
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is None:
+            return
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+
+
+_smtp_pool = _SMTPPool()
+
+
+def _build_message(
+    to_email: str, subject: str, body: str, subtype: str = "plain"
+) -> MIMEText:
+    """Création du message MIME"""
     msg = MIMEText(body, subtype)
     msg["Subject"] = subject
     msg["From"] = EMAIL_FROM
     msg["To"] = to_email
+    return msg
+
 
+def _deliver(to_email: str, msg: MIMEText):
+    """Envoie un message sur la connexion partagée, en se reconnectant une fois si elle a été coupée"""
     try:
-        # Choix de la classe de connexion en fonction de SSL
-        server_class: type[smtplib.SMTP] = smtplib.SMTP_SSL if SMTP_USE_SSL else smtplib.SMTP
+        _smtp_pool.get().sendmail(EMAIL_FROM, [to_email], msg.as_string())
+    except smtplib.SMTPServerDisconnected:
+        _smtp_pool.close()
+        _smtp_pool.get().sendmail(EMAIL_FROM, [to_email], msg.as_string())
+
 
-        with server_class(SMTP_SERVER, SMTP_PORT) as server:
-            # Démarrage TLS si configuré (uniquement pour les connexions non-SSL)
-            if SMTP_USE_TLS and not SMTP_USE_SSL:
-                server.starttls()
+def _send_now(to_email: str, subject: str, body: str, subtype: str = "plain"):
+    """Envoi synchrone d'un email, depuis le thread d'envoi"""
 
-            # Authentification si les identifiants sont fournis
-            if SMTP_USER and SMTP_PASSWORD:
-                server.login(SMTP_USER, SMTP_PASSWORD)
+    msg = _build_message(to_email, subject, body, subtype)
 
-            # Envoi de l'email
-            server.sendmail(EMAIL_FROM, [to_email], msg.as_string())
+    try:
+        _deliver(to_email, msg)
     except Exception as e:
+        # Connexion dans un état inconnu : elle sera rouverte au prochain envoi
+        _smtp_pool.close()
         print(f"Erreur lors de l'envoi de l'email: {e}")
 
 
+# File des emails à envoyer, consommée par un thread dédié pour que l'appelant
+# n'attende pas les allers-retours SMTP
+# (None est la sentinelle d'arrêt posée par shutdown_email_sender)
+_EMAIL_QUEUE: "queue.Queue[tuple[str, str, str, str] | None]" = queue.Queue()
+_sender_thread: threading.Thread | None = None
+_sender_lock = threading.Lock()
+
+
+def _sender_loop():
+    """Envoie les emails de la file sur la connexion SMTP du thread d'envoi"""
+    while True:
+        message = _EMAIL_QUEUE.get()
+        try:
+            if message is None:
+                # Sentinelle d'arrêt : les emails mis en file avant elle sont partis
+                _smtp_pool.close()
+                return
+            _send_now(*message)
+        finally:
+            _EMAIL_QUEUE.task_done()
+
+
+def _ensure_sender():
+    """Démarre le thread d'envoi au premier email"""
+    global _sender_thread
+    if _sender_thread is not None and _sender_thread.is_alive():
+        return
+    with _sender_lock:
+        if _sender_thread is None or not _sender_thread.is_alive():
+            _sender_thread = threading.Thread(
+                target=_sender_loop, name="email-sender", daemon=True
+            )
+            _sender_thread.start()
+
+
+def shutdown_email_sender(timeout: float = 10.0) -> bool:
+    """Envoie les emails encore en file puis arrête le thread d'envoi.
+
+    Retourne False si la file n'a pas pu être vidée dans le délai imparti.
+    """
+    global _sender_thread
+    with _sender_lock:
+        thread = _sender_thread
+        if thread is None or not thread.is_alive():
+            return True
+        _EMAIL_QUEUE.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            return False
+        _sender_thread = None
+    return True
+
+
+def send_email(to_email: str, subject: str, body: str, subtype: str = "plain"):
+    """Méthode générique pour envoyer des emails (envoi en arrière-plan)"""
+    _ensure_sender()
+    _EMAIL_QUEUE.put((to_email, subject, body, subtype))
+
+
+def send_email_batch(messages: Iterable[tuple[str, str, str, str]]):
+    """Envoie plusieurs emails (to_email, subject, body, subtype) sur une même session SMTP"""
+    _ensure_sender()
+    for message in messages:
+        _EMAIL_QUEUE.put(message)
+
+
 def send_reset_email(to_email: str, token: str):
     """Méthode pour envoyer un email de réinitialisation de mot de passe"""
 
@@ -29,12 +29,12 @@
 #  SOFTWARE.
 #
 
-import random
-import string
-from typing import Optional
+import functools
+
+from . import codename
 
 # 120 epic adjectives evoking mythic grandeur
-adjectives = [
+adjectives = (
     "august",
     "auric",
     "abyssal",
@@ -155,10 +155,10 @@ adjectives = [
     "lofty",
     "resplendent",
     "arcadian",
-]
+)
 
 # 120 myth‑themed adverbs for extra flair
-adverbs = [
+adverbs = (
     "augustly",
     "awesomely",
     "blessedly",
@@ -279,11 +279,11 @@ adverbs = [
     "sunward",
     "tempestuously",
     "terrestrially",
-]
+)
 
 # 300 mythological figures grouped by pantheon & role
 
-names = [
+names = (
     # ============================= EGYPTIAN GODS ============================
     "Ra",
     "Osiris",
@@ -603,65 +603,13 @@ names = [
     "Mielikki",
     "Hiisi",
     "Kauko",
-]
-
-
-def random_string(length: int) -> str:
-    """Return a random lowercase alphanumeric string of the given length."""
-    return "".join(random.choices(string.ascii_lowercase + string.digits, k=length))
-
-
-def generate_codename(
-    prefix_length: int = 0,
-    use_adjective: bool = True,
-    use_adverb: bool = False,
-    suffix_length: int = 0,
-    separator: str = "-",
-    style: Optional[str] = None,
-) -> str:
-    """Generate a memorable codename composed of random parts.
-
-    Styles mimic popular schemes:
-    - "ubuntu": adjective + myth name + 3‑char suffix
-    - "docker": adverb + myth name + 4‑char suffix
-    - "full": 3‑char prefix + adverb + adjective + myth name + 4‑char suffix
-    """
-
-    # Apply presets based on style
-    if style == "ubuntu":
-        use_adjective = True
-        use_adverb = False
-        prefix_length = 0
-        suffix_length = 3
-        separator = "-"
-    elif style == "docker":
-        use_adjective = False
-        use_adverb = True
-        prefix_length = 0
-        suffix_length = 4
-        separator = "-"
-    elif style == "full":
-        use_adjective = True
-        use_adverb = True
-        prefix_length = 3
-        suffix_length = 4
-        separator = "-"
-
-    parts = []
-
-    if prefix_length > 0:
-        parts.append(random_string(prefix_length))
-
-    if use_adverb:
-        parts.append(random.choice(adverbs))
-
-    if use_adjective:
-        parts.append(random.choice(adjectives))
-
-    # Always include a mythological name
-    parts.append(random.choice(names))
+)
 
-    if suffix_length > 0:
-        parts.append(random_string(suffix_length))
 
-    return separator.join(parts)
+# Generators bound to the word lists of this module
+generate_codenames = functools.partial(
+    codename.generate_codenames, adjectives, adverbs, names
+)
+generate_codename = functools.partial(
+    codename.generate_codename, adjectives, adverbs, names
+)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 from datetime import datetime
 from typing import Any
 
-from .croniter import croniter
+from .croniter import CroniterBadTypeRangeError, CroniterError, croniter
 
 
 def is_in_cron_interval(test_dt, cron_start_expr, cron_end_expr):
@@ -17,19 +19,74 @@ def is_in_cron_interval(test_dt, cron_start_expr, cron_end_expr):
     :return: bool - True si test_dt est dans l'intervalle [début, fin[
     """
     # Trouver la dernière occurrence de début <= test_dt
-    iter_start = croniter.croniter(cron_start_expr, test_dt)
+    iter_start = croniter(cron_start_expr, test_dt)
     prev_start = iter_start.get_prev(datetime)
     next_start = iter_start.get_next(datetime)
     start_occurrence = prev_start if next_start != test_dt else test_dt
 
     # Trouver la prochaine occurrence de fin après le début trouvé
-    iter_end = croniter.croniter(cron_end_expr, start_occurrence)
+    iter_end = croniter(cron_end_expr, start_occurrence)
     end_occurrence = iter_end.get_next(datetime)
 
     # Vérifier l'intervalle [début, fin[
     return start_occurrence <= test_dt < end_occurrence
 
 
+@functools.lru_cache(maxsize=4096)
+def _is_in_cron_interval_at(test_dt, cron_start_expr, cron_end_expr):
+    """
+    Version mémoïsée de is_in_cron_interval pour une date arrondie à la résolution
+    des règles cron (voir _cron_resolution_now).
+
+    Le résultat est le même pour toutes les vérifications d'une même minute (ou
+    seconde) : les expressions ne sont analysées qu'une fois par couple (début, fin).
+    """
+    try:
+        return is_in_cron_interval(test_dt, cron_start_expr, cron_end_expr)
+    except (CroniterError, CroniterBadTypeRangeError):
+        # Règle cron invalide : on autorise l'accès par défaut (résultat mémoïsé)
+        return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_access_schedule(access_schedule: str) -> tuple[str, str] | None:
+    """
+    Extrait les règles cron (début, fin) d'un access_schedule sérialisé en JSON.
+
+    Mémoïsé sur la chaîne brute : un même horaire n'est décodé qu'une fois, quel
+    que soit le nombre de vérifications de permission.
+
+    :return: tuple - (début, fin), ou None si le format n'est pas correct
+    """
+    try:
+        schedule = json.loads(access_schedule)
+    except json.JSONDecodeError:
+        return None
+    return _schedule_bounds(schedule)
+
+
+def _schedule_bounds(schedule: Any) -> tuple[str, str] | None:
+    """Retourne (début, fin) d'un access_schedule décodé, ou None s'il est incomplet"""
+    if not isinstance(schedule, dict):
+        return None
+    start = schedule.get("start")
+    end = schedule.get("end")
+    if not isinstance(start, str) or not isinstance(end, str):
+        return None
+    return start, end
+
+
+def _cron_resolution_now(bounds: tuple[str, str]) -> datetime:
+    """
+    Retourne l'heure actuelle arrondie à la résolution des règles cron : la minute
+    pour les expressions à 5 champs, la seconde si l'une d'elles a un champ secondes.
+    """
+    now = datetime.now()
+    if any(len(expr.split()) > 5 for expr in bounds):
+        return now.replace(microsecond=0)
+    return now.replace(second=0, microsecond=0)
+
+
 def is_rule_accessible_now(rule):
     """
     Vérifie si une règle est accessible au moment actuel en fonction de son access_schedule.
@@ -41,25 +98,24 @@ def is_rule_accessible_now(rule):
     if not rule.access_schedule:
         return True
 
-    try:
-        # Parser le JSON de l'access_schedule
-        if isinstance(rule.access_schedule, str):
-            schedule = json.loads(rule.access_schedule)
-        else:
-            schedule = rule.access_schedule
-
-        # Vérifier que les clés 'start' et 'end' sont présentes
-        if "start" not in schedule or "end" not in schedule:
-            return True  # Si le format n'est pas correct, on autorise l'accès
-
-        # Vérifier si l'heure actuelle est dans l'intervalle
-        current_time = datetime.now()
-        return is_in_cron_interval(current_time, schedule["start"], schedule["end"])
-
-    except (json.JSONDecodeError, KeyError, Exception):
-        # En cas d'erreur de parsing ou autre, on autorise l'accès par défaut
+    # Récupérer les règles cron de l'access_schedule (JSON décodé une seule fois)
+    if isinstance(rule.access_schedule, str):
+        bounds = _parse_access_schedule(rule.access_schedule)
+    else:
+        bounds = _schedule_bounds(rule.access_schedule)
+
+    # Si le format n'est pas correct (JSON invalide, clés 'start'/'end' absentes),
+    # on autorise l'accès
+    if bounds is None:
         return True
 
+    # Vérifier si l'heure actuelle est dans l'intervalle
+    return _is_in_cron_interval_at(_cron_resolution_now(bounds), *bounds)
+
+
+# Cible absente : ne correspond à aucun environnement ni élément de règle
+_NO_TARGET = object()
+
 
 def has_permission(
     db: Any,
@@ -96,72 +152,70 @@ def has_permission(
     if user.is_superadmin:
         return True
 
-    # Récupérer toutes les policies applicables à l'utilisateur
-    applicable_policies = set()
-
-    # Pour chaque organisation de l'utilisateur
-    for organization in user.organizations:
-        # Policies des groupes de l'utilisateur dans cette organisation
-        for group in user.groups:
-            if group.organization_id == organization.id:
-                for policy in group.policies:
-                    if policy.organization_id == organization.id:
-                        applicable_policies.add(policy)
-
-        # Policies directement associées à l'utilisateur
-        for policy in user.policies:
-            if policy.organization_id == organization.id:
-                applicable_policies.add(policy)
-
-    # Vérifier les règles de chaque policy applicable
+    # Récupérer toutes les policies applicables à l'utilisateur :
+    # - celles des groupes de l'utilisateur dans chacune de ses organisations
+    # - celles directement associées à l'utilisateur dans ces organisations
+    organization_ids = {organization.id for organization in user.organizations}
+    applicable_policies = {
+        policy
+        for group in user.groups
+        if group.organization_id in organization_ids
+        for policy in group.policies
+        if policy.organization_id == group.organization_id
+    } | {
+        policy for policy in user.policies if policy.organization_id in organization_ids
+    }
+
+    # Permissions demandées, mises en minuscules une seule fois
+    if permission is None:
+        permissions: set[str] = set()
+    elif isinstance(permission, list):
+        permissions = {perm.lower() for perm in permission}
+    else:
+        permissions = {permission.lower()}
+
+    # Règles candidates : les règles "admin" d'abord, qui donnent tous les droits
+    # sur leur périmètre, puis celles de la permission demandée
+    admin_rules = []
+    permission_rules = []
     for policy in applicable_policies:
         for rule in policy.rules:
-            # Vérifier que la fonction correspond à la permission demandée
-            if isinstance(permission, list):
-                check = any(
-                    str.lower(perm) == rule.function.name for perm in permission
-                )
-            elif permission is None:
-                check = False
-            else:
-                check = str.lower(permission) == rule.function.name
-            if check or rule.function.name == "admin":
-                # Vérifier d'abord si la règle est accessible selon son horaire
-                if not is_rule_accessible_now(rule):
-                    continue  # Passer à la règle suivante si pas accessible maintenant
-
-                # Cas où les deux sont None: la règle s'applique à tous les environnements et éléments
-                if rule.environment_id is None and rule.element_id is None:
-                    return True
-
-                # Cas où target_env et target_element sont tous les deux None
-                if target_env is None and target_element is None:
-                    # On retourne True seulement si les deux éléments des règles sont à None
-                    if rule.environment_id is None and rule.element_id is None:
-                        return True
-
-                # Cas où target_element est None: on vérifie par rapport à target_env
-                elif target_element is None:
-                    if rule.environment_id == target_env:
-                        return True
-
-                # Cas où target_env est None: on vérifie par rapport à target_element
-                elif target_env is None:
-                    if rule.element_id == target_element.id:
-                        return True
-                    if rule.environment_id == target_element.environment_id:
-                        return True
-
-                # Cas où les deux sont spécifiés
-                else:
-                    # Si la règle s'applique directement à l'élément
-                    if rule.element_id == target_element.id:
-                        return True
-                    # Si la règle s'applique à l'environnement de l'élément ou à l'environnement cible
-                    if (
-                        rule.environment_id == target_element.environment_id
-                        or rule.environment_id == target_env
-                    ):
-                        return True
+            function_name = rule.function.name
+            if function_name == "admin":
+                admin_rules.append(rule)
+            elif function_name in permissions:
+                permission_rules.append(rule)
+
+    # Cible résolue une seule fois, hors de la boucle sur les règles
+    env_key = _NO_TARGET if target_env is None else target_env
+    if target_element is None:
+        element_key = element_env_key = _NO_TARGET
+    else:
+        element_key = target_element.id
+        element_env_key = target_element.environment_id
+
+    # Horaire d'accès évalué une seule fois par règle pour cette vérification, indexé
+    # sur la règle elle-même : des règles transitoires (id None) restent distinctes
+    accessible_rules: dict[Any, bool] = {}
+
+    for rule in itertools.chain(admin_rules, permission_rules):
+        # La règle s'applique si elle ne vise ni environnement ni élément, si elle
+        # vise l'élément cible ou son environnement, ou l'environnement cible
+        environment_id = rule.environment_id
+        element_id = rule.element_id
+        if not (
+            (environment_id is None and element_id is None)
+            or element_id == element_key
+            or environment_id == element_env_key
+            or environment_id == env_key
+        ):
+            continue
+
+        # La règle s'applique à la cible : vérifier qu'elle est accessible selon son horaire
+        accessible = accessible_rules.get(rule)
+        if accessible is None:
+            accessible = accessible_rules[rule] = is_rule_accessible_now(rule)
+        if accessible:
+            return True
 
     return False
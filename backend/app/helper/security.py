@@ -1,11 +1,14 @@
 import bcrypt
 
 from ..auth import jwt as auth
+from ..config import settings
 
 
 # Hashage
 def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    ).decode()
 
 
 # Vérification
@@ -5,16 +5,95 @@ Fournit un moteur de rendu unifié avec toutes les fonctions personnalisées
 disponibles pour tous les types de déploiement (Docker, Docker Compose, etc.)
 """
 
+import functools
 import logging
 from typing import Any, Dict
 
-from jinja2 import Template, TemplateSyntaxError, UndefinedError
+from jinja2 import Environment, Template, TemplateSyntaxError, UndefinedError
 
 from .jinja_functions import JINJA_FUNCTIONS
 
 logger = logging.getLogger(__name__)
 
 
+def _is_literal(value: str) -> bool:
+    """
+    Indique si une string ressort inchangée d'un rendu Jinja2.
+
+    Sans délimiteur `{{`, `{%` ou `{#`, Jinja2 ne fait que normaliser les fins
+    de ligne (`\r`) et retirer un `\n` final : ces cas passent par le rendu.
+    """
+    if "\r" in value or value.endswith("\n"):
+        return False
+    return "{{" not in value and "{%" not in value and "{#" not in value
+
+
+def _make_environment(functions: Dict[str, Any]) -> Environment:
+    """Environnement Jinja2 exposant les fonctions comme globales des templates."""
+    environment = Environment(autoescape=False, auto_reload=False)
+    environment.globals.update(functions)
+    return environment
+
+
+# Environnement partagé par les renderers sans fonctions supplémentaires
+_ENVIRONMENT = _make_environment(dict(JINJA_FUNCTIONS))
+
+
+def _make_compiler(environment: Environment, maxsize: int):
+    """
+    Compilateur mémoïsé de sources Jinja2 pour un environnement.
+
+    Le parsing et la compilation coûtent bien plus que le rendu ; un Template
+    compilé est sans état et peut être partagé entre les renderers. Une erreur
+    de syntaxe est mémoïsée elle aussi (retournée plutôt que levée) : revalider
+    le même template invalide ne le reparse pas.
+    """
+
+    @functools.lru_cache(maxsize=maxsize)
+    def compile_source(source: str) -> Template | TemplateSyntaxError:
+        try:
+            return environment.from_string(source)
+        except TemplateSyntaxError as e:
+            return e
+
+    return compile_source
+
+
+# Cache de compilation partagé par les renderers sans fonctions supplémentaires
+_compile_template = _make_compiler(_ENVIRONMENT, maxsize=2048)
+
+
+def _node_kind(value: Any) -> type | None:
+    """
+    Nature d'un nœud de template : dict, list, str, ou None pour les autres types.
+
+    Le type exact est résolu par une seule recherche ; les sous-classes
+    (OrderedDict, str enum...) sont rattachées à leur type de base.
+    """
+    kind = _NODE_KINDS.get(type(value), _UNKNOWN)
+    if kind is not _UNKNOWN:
+        return kind
+    for base in (dict, list, str):
+        if isinstance(value, base):
+            return base
+    return None
+
+
+# Profondeur d'imbrication maximale d'un template rendu
+_MAX_DEPTH = 100_000
+
+_UNKNOWN = object()
+_NODE_KINDS: Dict[type, Any] = {
+    dict: dict,
+    list: list,
+    str: str,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+}
+
+
 class TemplateRenderer:
     """
     Renderer Jinja2 avec fonctions personnalisées enregistrées.
@@ -36,11 +115,42 @@ class TemplateRenderer:
         # Ajouter des fonctions supplémentaires si fournies
         if additional_functions:
             self.functions.update(additional_functions)
+            # Environnement et cache de compilation propres à ce renderer
+            self._compile = _make_compiler(
+                _make_environment(self.functions), maxsize=256
+            )
+        else:
+            self._compile = _compile_template
 
         logger.debug(
             f"TemplateRenderer initialisé avec {len(self.functions)} fonctions"
         )
 
+    def _get_template(self, source: str) -> Template:
+        """
+        Template compilé pour une source, depuis le cache de compilation partagé
+        par le rendu et la validation.
+
+        Raises:
+            TemplateSyntaxError: Source invalide (erreur mémoïsée)
+        """
+        compiled = self._compile(source)
+        if isinstance(compiled, TemplateSyntaxError):
+            raise compiled.with_traceback(None)
+        return compiled
+
+    def warmup(self, template: Any) -> None:
+        """
+        Pré-compile les strings Jinja2 d'un template sans le rendre.
+
+        À appeler à l'enregistrement d'un template pour que son premier rendu
+        trouve les sources déjà compilées dans le cache.
+
+        Args:
+            template: Template à pré-compiler (dict, list ou str)
+        """
+        self.validate_template(template, check_undefined=False)
+
     def render_dict(
         self, template: Dict[str, Any], variables: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -71,8 +181,9 @@ class TemplateRenderer:
             >>> result["environment"]["USER"]
             'admin'
         """
-        # Créer le contexte de rendu avec variables utilisateur + fonctions
-        context = {**variables, **self.functions}
+        # Les fonctions sont des globales de l'environnement : seules les
+        # variables utilisateur forment le contexte de rendu, construit une fois
+        context = self._variables_context(variables)
 
         # Rendre récursivement
         return self._render_value(template, context)
@@ -99,15 +210,19 @@ class TemplateRenderer:
             >>> len(result.split(": ")[1])
             12
         """
+        if _is_literal(template_str):
+            # Aucune expression Jinja2 : inutile de compiler
+            return template_str
+
         # Créer le contexte de rendu
-        context = {**variables, **self.functions}
+        context = self._variables_context(variables)
 
         try:
             # Créer le template Jinja2
-            jinja_template = Template(template_str)
+            jinja_template = self._get_template(template_str)
 
             # Rendre avec le contexte
-            rendered = jinja_template.render(**context)
+            rendered = jinja_template.render(context)
 
             return rendered
 
@@ -126,59 +241,104 @@ class TemplateRenderer:
             # Retourner le template original en cas d'erreur
             return template_str
 
+    def _variables_context(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Contexte de rendu à partir des variables utilisateur.
+
+        Comme auparavant, une fonction l'emporte sur une variable de même nom :
+        ces variables sont écartées pour ne pas masquer la globale.
+        """
+        if self.functions.keys() & variables.keys():
+            return {
+                key: val for key, val in variables.items() if key not in self.functions
+            }
+        return variables
+
     def _render_value(self, value: Any, context: Dict[str, Any]) -> Any:
         """
-        Rend une valeur (peut être dict, list, str, etc.) de manière récursive.
+        Rend une valeur (peut être dict, list, str, etc.) en profondeur.
+
+        Parcours itératif avec une pile explicite plutôt que récursif : pas
+        d'appel de fonction par nœud ni de RecursionError sur les templates très
+        imbriqués. Les dictionnaires et listes sont copiés (copie superficielle)
+        puis leurs strings remplacées dans la copie ; le template n'est jamais
+        modifié.
 
         Args:
             value: Valeur à rendre
-            context: Contexte de rendu (variables + fonctions)
+            context: Contexte de rendu (variables utilisateur, les fonctions
+                sont des globales de l'environnement)
 
         Returns:
             Valeur rendue
         """
-        if isinstance(value, dict):
-            # Dictionnaire : rendre récursivement chaque valeur
-            return {key: self._render_value(val, context) for key, val in value.items()}
-
-        elif isinstance(value, list):
-            # Liste : rendre récursivement chaque élément
-            return [self._render_value(item, context) for item in value]
-
-        elif isinstance(value, str):
-            # String : appliquer la substitution Jinja2
-            try:
-                # Créer un template Jinja2
-                jinja_template = Template(value)
-
-                # Rendre avec le contexte
-                rendered = jinja_template.render(**context)
+        kind = _node_kind(value)
+        if kind is None:
+            # Types primitifs (int, bool, None, etc.) : retourner tel quel
+            return value
+        if kind is str:
+            return self._render_str(value, context)
+
+        # Pile de (conteneur copié, clé ou index, valeur à rendre, nature, profondeur)
+        root = [value]
+        stack = [(root, 0, value, kind, 0)]
+        while stack:
+            parent, key, node, kind, depth = stack.pop()
+            if kind is str:
+                parent[key] = self._render_str(node, context)
+                continue
+
+            if depth > _MAX_DEPTH:
+                # Structure cyclique (ancre YAML récursive...) : pas de boucle infinie
+                raise RecursionError("Template trop imbriqué ou cyclique")
+
+            # Dictionnaire ou liste : copie dont les éléments seront rendus
+            if kind is dict:
+                copy: Any = dict(node)
+                items = copy.items()
+            else:
+                copy = list(node)
+                items = enumerate(copy)
+            parent[key] = copy
+
+            for child_key, child in items:
+                child_kind = _node_kind(child)
+                if child_kind is not None:
+                    stack.append((copy, child_key, child, child_kind, depth + 1))
+
+        return root[0]
+
+    def _render_str(self, value: str, context: Dict[str, Any]) -> Any:
+        """String : appliquer la substitution Jinja2."""
+        if _is_literal(value):
+            # Littéral (la majorité des valeurs) : rien à substituer
+            return value
 
-                return rendered
+        try:
+            # Créer un template Jinja2
+            jinja_template = self._get_template(value)
 
-            except TemplateSyntaxError as e:
-                logger.warning(f"Erreur de syntaxe Jinja2 dans '{value}': {e}")
-                return value
+            # Rendre avec le contexte
+            # Mapping passé tel quel, sans redéballage en kwargs
+            rendered = jinja_template.render(context)
 
-            except UndefinedError as e:
-                logger.warning(f"Variable non définie dans '{value}': {e}")
-                return value
+            return rendered
 
-            except Exception as e:
-                logger.warning(f"Erreur lors du rendu de '{value}': {e}")
-                return value
+        except TemplateSyntaxError as e:
+            logger.warning(f"Erreur de syntaxe Jinja2 dans '{value}': {e}")
+            return value
 
-        else:
-            # Types primitifs (int, bool, None, etc.) : retourner tel quel
+        except UndefinedError as e:
+            logger.warning(f"Variable non définie dans '{value}': {e}")
             return value
 
-    def get_available_functions(self) -> Dict[str, str]:
-        """
-        Retourne la liste des fonctions disponibles avec leur documentation.
+        except Exception as e:
+            logger.warning(f"Erreur lors du rendu de '{value}': {e}")
+            return value
 
-        Returns:
-            Dictionnaire {nom_fonction: docstring}
-        """
+    @functools.cached_property
+    def _functions_doc(self) -> Dict[str, str]:
+        """Première ligne de docstring de chaque fonction, calculée une seule fois."""
         functions_doc = {}
 
         for name, func in self.functions.items():
@@ -189,6 +349,18 @@ class TemplateRenderer:
 
         return functions_doc
 
+    def get_available_functions(self) -> Dict[str, str]:
+        """
+        Retourne la liste des fonctions disponibles avec leur documentation.
+
+        Les fonctions ne changent pas après l'initialisation : la documentation
+        est extraite au premier appel puis servie depuis le cache.
+
+        Returns:
+            Dictionnaire {nom_fonction: docstring}
+        """
+        return dict(self._functions_doc)
+
     def validate_template(
         self, template: Any, check_undefined: bool = True
     ) -> tuple[bool, list[str]]:
@@ -217,9 +389,13 @@ class TemplateRenderer:
                     validate_value(item, f"{path}[{i}]")
 
             elif isinstance(value, str):
+                if _is_literal(value):
+                    # Aucune expression Jinja2 : pas d'erreur de syntaxe possible
+                    return
+
                 # Vérifier la syntaxe Jinja2
                 try:
-                    Template(value)
+                    self._get_template(value)
                 except TemplateSyntaxError as e:
                     errors.append(f"Erreur de syntaxe Jinja2 à {path}: {e}")
                 except Exception as e:
@@ -9,32 +9,36 @@ Enterprise-grade API with:
 - Performance monitoring
 """
 
-print("=== LOADING backend.app.main MODULE ===", flush=True)
-
 import asyncio
+import json
 import logging
+import queue
+import socket
+import time
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 import redis.asyncio as redis
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 # Rate limiting
 from fastapi_limiter import FastAPILimiter
 from pydantic import ValidationError
+from redis.exceptions import RedisError
 from scalar_fastapi import get_scalar_api_reference
+from sqlalchemy.exc import SQLAlchemyError
 
 from .api.v1 import api_router
 from .config import settings
 from .database import db
+from .helper.email import shutdown_email_sender
 from .middleware import (
-    correlation_middleware,
-    error_handler_middleware,
-    logging_middleware,
-    security_headers_middleware,
-    timing_middleware,
+    ErrorHandlerMiddleware,
+    RequestContextMiddleware,
+    SecurityHeadersMiddleware,
 )
 
 # Configure logging
@@ -49,29 +53,68 @@ logging.basicConfig(
 
 # Force SQLAlchemy engine logger to respect configured LOG_LEVEL
 # This prevents SQLAlchemy from using its own handler at INFO level when echo=True
-logging.getLogger("sqlalchemy.engine").setLevel(
-    getattr(logging, settings.log_level)
-)
+logging.getLogger("sqlalchemy.engine").setLevel(getattr(logging, settings.log_level))
 
 logger = logging.getLogger(__name__)
 
 
+def _start_log_listener() -> QueueListener:
+    """
+    Move log output off the event loop.
+
+    The root handlers are served by a QueueListener thread; in the request
+    path, logging a record only costs a queue put.
+    """
+    root_logger = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, *root_logger.handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush queued records and give the handlers back to the root logger."""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+# Database kind, fixed by the configuration at startup
+_DB_KIND = "sqlite" if "sqlite" in settings.database_url else "postgresql"
+
+# Redis key of the last /health result, shared by the workers of this host only:
+# every API instance must report its own database and Redis status
+_HEALTH_CACHE_KEY = f"windflow:health:{socket.gethostname()}"
+
+# In-process /health cache (monotonic timestamp, result) to absorb frequent probes
+_HEALTH_LOCAL_TTL = 2.0
+_health_local: tuple[float, dict] | None = None
+_health_lock = asyncio.Lock()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifecycle management.
 
     Startup:
+    - Start the background log listener
     - Initialize database
     - Setup event bridge
     - Initialize rate limiter
-    - Recover pending deployments
+    - Recover pending deployments (background task)
 
     Shutdown:
     - Close database connections
     - Close Redis connections
+    - Flush the email queue
+    - Stop the background log listener
     """
     # === STARTUP ===
+    log_listener = _start_log_listener()
+
     logger.info("=" * 60)
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {settings.environment}")
@@ -93,9 +136,15 @@ async def lifespan(app: FastAPI):
     if settings.rate_limit_enabled and settings.rate_limit_storage_url:
         try:
             redis_client = redis.from_url(
-                settings.rate_limit_storage_url, encoding="utf-8", decode_responses=True
+                settings.rate_limit_storage_url,
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=10,
+                socket_keepalive=True,
             )
             await FastAPILimiter.init(redis_client)
+            # Client shared with the endpoints (/health cache)
+            app.state.redis = redis_client
             logger.info(
                 f"✓ Rate limiter initialized (Redis: {settings.rate_limit_storage_url})"
             )
@@ -110,19 +159,31 @@ async def lifespan(app: FastAPI):
             "  For production, configure Redis: RATE_LIMIT_STORAGE_URL=redis://localhost:6379/0"
         )
 
-    # Recover pending deployments
-    try:
+    # Recover pending deployments in the background so that /health answers
+    # (and the instance becomes ready) while recovery is still running
+    async def _recover_pending_deployments() -> dict:
         from .services.deployment_orchestrator import DeploymentOrchestrator
 
-        stats = await DeploymentOrchestrator.recover_pending_deployments(
+        return await DeploymentOrchestrator.recover_pending_deployments(
             max_age_minutes=0, timeout_minutes=60
         )
 
+    def _log_recovery(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"✗ Deployment recovery failed: {exc}")
+            return
+        stats = task.result()
         logger.info(
             f"✓ Deployment recovery: {stats['retried']} retried, {stats['failed']} failed"
         )
-    except Exception as e:
-        logger.error(f"✗ Deployment recovery failed: {e}")
+
+    recovery_task = asyncio.create_task(_recover_pending_deployments())
+    recovery_task.add_done_callback(_log_recovery)
+    app.state.recovery_task = recovery_task
+    logger.info("✓ Deployment recovery started in background")
 
     # Start periodic target health check (asyncio fallback when Celery is unavailable)
     health_task: asyncio.Task | None = None
@@ -166,19 +227,37 @@ async def lifespan(app: FastAPI):
             pass
         logger.info("✓ Periodic health check task cancelled")
 
+    # Cancel deployment recovery if still running
+    if not recovery_task.done():
+        recovery_task.cancel()
+        try:
+            await recovery_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("✓ Deployment recovery task cancelled")
+
     # Close rate limiter
     if settings.rate_limit_enabled and settings.rate_limit_storage_url:
         try:
+            # Also closes the shared Redis client (app.state.redis)
             await FastAPILimiter.close()
+            app.state.redis = None
             logger.info("✓ Rate limiter closed")
         except Exception:
             pass
 
+    # Flush queued emails (password resets, etc.) before the process exits
+    if await asyncio.to_thread(shutdown_email_sender, 10.0):
+        logger.info("✓ Email queue flushed")
+    else:
+        logger.warning("✗ Email queue not flushed within 10s")
+
     # Close database
     await db.disconnect()
     logger.info("✓ Database disconnected")
 
     logger.info("Application shutdown complete")
+    _stop_log_listener(log_listener)
 
 
 # Create FastAPI application
@@ -254,7 +333,11 @@ WindFlow uses JWT-based authentication:
 # === MIDDLEWARE CONFIGURATION ===
 # ⚠️  Order is CRITICAL - see backend/app/middleware/README.md
 
-# 1. CORS (first to receive request)
+# 1. Error handler (innermost): unhandled exceptions become a JSON 500 that
+#    still goes through CORS, security headers and request context
+app.add_middleware(ErrorHandlerMiddleware)
+
+# 2. CORS
 if settings.cors_enabled:
     app.add_middleware(
         CORSMiddleware,
@@ -266,26 +349,22 @@ if settings.cors_enabled:
     )
     logger.info(f"✓ CORS enabled for origins: {settings.cors_origins_list}")
 
-# 2. Security Headers
+# 3. Security Headers
 if settings.csp_enabled:
-    app.middleware("http")(security_headers_middleware)
+    app.add_middleware(SecurityHeadersMiddleware)
     logger.info("✓ Security headers middleware enabled")
 
-# 3. Timing (must be early to wrap entire request)
-if settings.enable_timing_middleware:
-    app.middleware("http")(timing_middleware)
-    logger.info("✓ Timing middleware enabled")
-
-# 4. Correlation ID
+# 4. Request context (outermost): correlation ID, timing and logging in a single layer
+app.add_middleware(
+    RequestContextMiddleware,
+    correlation_id=settings.enable_correlation_id,
+    timing=settings.enable_timing_middleware,
+    slow_request_threshold=settings.slow_request_threshold,
+)
 if settings.enable_correlation_id:
-    app.middleware("http")(correlation_middleware)
-    logger.info("✓ Correlation ID middleware enabled")
-
-# 5. Logging
-app.middleware("http")(logging_middleware)
-
-# 6. Error Handler (last to catch all errors)
-app.middleware("http")(error_handler_middleware)
+    logger.info("✓ Correlation ID tracking enabled")
+if settings.enable_timing_middleware:
+    logger.info("✓ Request timing enabled")
 
 # === ROUTERS ===
 app.include_router(api_router)
@@ -293,10 +372,9 @@ app.include_router(api_router)
 # === ROOT ENDPOINTS ===
 
 
-@app.get("/", include_in_schema=False)
-async def root():
-    """Root endpoint with API information."""
-    return {
+# Root response, serialized once: it only depends on the configuration
+_ROOT_BODY = json.dumps(
+    {
         "name": settings.app_name,
         "version": settings.app_version,
         "status": "running",
@@ -309,17 +387,53 @@ async def root():
         },
         "api": "/api/v1",
         "health": "/health",
-    }
+    },
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
 
 
-@app.get("/health", tags=["health"])
-async def health_check():
-    """
-    Health check endpoint for monitoring and load balancers.
+@app.get("/", include_in_schema=False)
+async def root():
+    """Root endpoint with API information."""
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+def _health_response(health_status: dict):
+    """Build the /health response: 503 when the application is degraded."""
+    if health_status["status"] != "healthy":
+        return JSONResponse(status_code=503, content=health_status)
+    return health_status
+
+
+def _task_status(task: asyncio.Future) -> str:
+    """Return the state of a background task: "running", "done" or "failed"."""
+    if not task.done():
+        return "running"
+    if task.cancelled() or task.exception() is not None:
+        return "failed"
+    return "done"
+
+
+async def _ping_redis(redis_client) -> bool:
+    """Ping the shared client: no connection is opened per probe."""
+    if redis_client is None:
+        return False
+    await redis_client.ping()
+    return True
+
+
+async def _get_health_status(redis_client) -> dict:
+    """Return the /health result, read from the Redis cache or computed live."""
+    if redis_client is not None and settings.health_cache_ttl > 0:
+        try:
+            cached = await redis_client.get(_HEALTH_CACHE_KEY)
+        except (RedisError, OSError):
+            # The cache is an optimization: if Redis is down, run the checks live
+            cached = None
+        if cached:
+            return json.loads(cached)
 
-    Returns:
-        Health status including database and optional services
-    """
     health_status = {
         "status": "healthy",
         "version": settings.app_version,
@@ -327,32 +441,78 @@ async def health_check():
         "services": {},
     }
 
+    # Database and rate limiter are probed concurrently
+    check_rate_limiter = bool(
+        settings.rate_limit_enabled and settings.rate_limit_storage_url
+    )
+    probes = [db.health_check()]
+    if check_rate_limiter:
+        probes.append(_ping_redis(redis_client))
+    results = await asyncio.gather(*probes, return_exceptions=True)
+
     # Check database
-    db_healthy = await db.health_check()
+    db_healthy = results[0] is True
     health_status["services"]["database"] = {
         "status": "healthy" if db_healthy else "unhealthy",
-        "type": "sqlite" if "sqlite" in settings.database_url else "postgresql",
+        "type": _DB_KIND,
     }
 
     # Check rate limiter
-    if settings.rate_limit_enabled and settings.rate_limit_storage_url:
-        try:
-            # Simple Redis ping
-            redis_client = redis.from_url(settings.rate_limit_storage_url)
-            await redis_client.ping()
-            health_status["services"]["rate_limiter"] = {"status": "healthy"}
-            await redis_client.close()
-        except Exception:
-            health_status["services"]["rate_limiter"] = {"status": "unhealthy"}
+    if check_rate_limiter:
+        health_status["services"]["rate_limiter"] = {
+            "status": "healthy" if results[1] is True else "unhealthy"
+        }
 
     # Global status
     if not db_healthy:
         health_status["status"] = "unhealthy"
-        return JSONResponse(status_code=503, content=health_status)
+
+    if redis_client is not None and settings.health_cache_ttl > 0:
+        try:
+            await redis_client.setex(
+                _HEALTH_CACHE_KEY, settings.health_cache_ttl, json.dumps(health_status)
+            )
+        except (RedisError, OSError):
+            pass
 
     return health_status
 
 
+@app.get("/health", tags=["health"])
+async def health_check(request: Request):
+    """
+    Health check endpoint for monitoring and load balancers.
+
+    The result is kept in process for ``_HEALTH_LOCAL_TTL`` seconds, then
+    cached in Redis for ``health_cache_ttl`` seconds so that frequent probes
+    do not hit the database; without Redis every refresh runs the checks live.
+    Concurrent probes share a single refresh. The state of the background
+    deployment recovery is reported as ``recovery``.
+
+    Returns:
+        Health status including database and optional services
+    """
+    global _health_local
+
+    cached = _health_local
+    if cached is None or time.monotonic() - cached[0] >= _HEALTH_LOCAL_TTL:
+        async with _health_lock:
+            # Another probe may have refreshed the cache while we waited for the lock
+            cached = _health_local
+            if cached is None or time.monotonic() - cached[0] >= _HEALTH_LOCAL_TTL:
+                redis_client = getattr(request.app.state, "redis", None)
+                cached = (time.monotonic(), await _get_health_status(redis_client))
+                _health_local = cached
+    health_status = cached[1]
+
+    # Recovery state is specific to this process: it is never cached
+    recovery_task = getattr(request.app.state, "recovery_task", None)
+    if recovery_task is not None:
+        health_status = {**health_status, "recovery": _task_status(recovery_task)}
+
+    return _health_response(health_status)
+
+
 # === SCALAR API DOCUMENTATION ===
 
 
@@ -416,13 +576,33 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
     )
 
 
+@app.exception_handler(SQLAlchemyError)
+async def database_exception_handler(request: Request, exc: SQLAlchemyError):
+    """Handle database errors without leaking their details."""
+    correlation_id = getattr(request.state, "correlation_id", None)
+
+    logger.error(f"Database error: {exc}", extra={"correlation_id": correlation_id})
+
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "error": "Database Error",
+            "detail": "An error occurred while accessing the database",
+            "path": str(request.url),
+            "correlation_id": correlation_id,
+        },
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
+    # Reload needs a single worker
     uvicorn.run(
         "backend.app.main:app",
         host="0.0.0.0",
         port=settings.api_port,
+        workers=1 if settings.debug else settings.api_workers,
         reload=settings.debug,
         reload_dirs=["backend/app"] if settings.debug else None,
         log_level=settings.log_level.lower(),
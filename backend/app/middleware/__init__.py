@@ -4,16 +4,12 @@ Middleware pour WindFlow Backend.
 Gestion des erreurs, logging structuré, sécurité, corrélation et timing.
 """
 
-from .correlation import correlation_middleware
-from .error_handler import error_handler_middleware
-from .logging_middleware import logging_middleware
-from .security import security_headers_middleware
-from .timing import timing_middleware
+from .error_handler import ErrorHandlerMiddleware
+from .request_context import RequestContextMiddleware
+from .security import SecurityHeadersMiddleware
 
 __all__ = [
-    "security_headers_middleware",
-    "correlation_middleware",
-    "timing_middleware",
-    "error_handler_middleware",
-    "logging_middleware",
+    "SecurityHeadersMiddleware",
+    "RequestContextMiddleware",
+    "ErrorHandlerMiddleware",
 ]
@@ -1,63 +1,75 @@
 """
-Middleware de gestion des erreurs personnalisées.
+Middleware de gestion des erreurs non gérées.
 
-Capture et formate les exceptions de manière cohérente.
+Transforme les exceptions qui ont échappé aux gestionnaires de FastAPI en
+réponse JSON 500, à l'intérieur de la pile de middlewares : la réponse
+d'erreur reçoit ainsi les en-têtes CORS, de sécurité, de corrélation et de
+timing, et elle est journalisée comme les autres requêtes.
 """
 
 import logging
 
-from fastapi import Request, status
-from fastapi.exceptions import RequestValidationError
+from fastapi import status
 from fastapi.responses import JSONResponse
-from sqlalchemy.exc import SQLAlchemyError
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-async def error_handler_middleware(request: Request, call_next):
+class ErrorHandlerMiddleware:
     """
     Middleware de gestion globale des erreurs.
 
-    Capture les exceptions non gérées et retourne des réponses JSON formatées.
+    Doit être ajouté en premier (couche la plus interne) pour que les autres
+    middlewares traitent la réponse d'erreur.
     """
-    # Skip WebSocket connections - they handle their own errors
-    if request.scope.get("type") == "websocket":
-        return await call_next(request)
-
-    try:
-        response = await call_next(request)
-        return response
-    except RequestValidationError as exc:
-        logger.warning(f"Validation error: {exc}")
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": "Validation Error",
-                "detail": exc.errors(),
-                "path": str(request.url),
-            },
-        )
-    except SQLAlchemyError as exc:
-        logger.error(f"Database error: {exc}")
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": "Database Error",
-                "detail": "An error occurred while accessing the database",
-                "path": str(request.url),
-            },
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip WebSocket connections - they handle their own errors
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            # Une réponse déjà commencée ne peut plus être remplacée
+            if response_started:
+                raise
+            response = self._error_response(scope, exc)
+            await response(scope, receive, send)
+
+    @staticmethod
+    def _error_response(scope: Scope, exc: Exception) -> JSONResponse:
+        """Journalise l'exception et construit la réponse JSON 500."""
+        correlation_id = scope.get("state", {}).get("correlation_id")
+
+        logger.exception(
+            f"Unhandled exception: {exc}", extra={"correlation_id": correlation_id}
         )
-    except Exception as exc:
-        logger.exception(f"Unhandled exception: {exc}")
+
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal Server Error",
                 "detail": (
                     str(exc)
-                    if logger.level <= logging.DEBUG
+                    if logger.isEnabledFor(logging.DEBUG)
                     else "An unexpected error occurred"
                 ),
-                "path": str(request.url),
+                "path": str(URL(scope=scope)),
+                "correlation_id": correlation_id,
             },
         )
@@ -0,0 +1,130 @@
+"""Request context middleware: correlation ID, timing and structured logging."""
+
+import logging
+import time
+from uuid import uuid4
+
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Probe and documentation paths: headers are still set, but no log record is
+# emitted for them (they would flood the logs without business value)
+_QUIET_PATHS = frozenset(
+    {"/health", "/health/ready", "/docs", "/swagger", "/redoc", "/openapi.json"}
+)
+
+
+class RequestContextMiddleware:
+    """
+    Track every HTTP request in a single ASGI layer.
+
+    - Reads X-Correlation-ID from request headers or generates a new UUID,
+      stores it in request.state and adds it to response headers
+    - Measures processing time, adds the X-Process-Time header and logs
+      slow requests as warnings
+    - Logs each processed request once, with method, path, status and timing
+      (except health probes and API documentation)
+
+    Correlation and timing can be disabled independently; logging is always on.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        correlation_id: bool = True,
+        timing: bool = True,
+        slow_request_threshold: float = 1.0,
+    ) -> None:
+        self.app = app
+        self.correlation_id = correlation_id
+        self.timing = timing
+        self._slow_request_ns = int(slow_request_threshold * 1_000_000_000)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip WebSocket connections (and lifespan events)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        correlation_id = None
+        extra_headers: list[tuple[bytes, bytes]] = []
+
+        if self.correlation_id:
+            # ASGI header names are lowercase bytes: scan the raw list directly
+            raw_id = None
+            for name, value in scope["headers"]:
+                if name == b"x-correlation-id":
+                    raw_id = value
+                    break
+            if raw_id:
+                correlation_id = raw_id.decode("latin-1")
+            else:
+                correlation_id = uuid4().hex
+                raw_id = correlation_id.encode("latin-1")
+            extra_headers.append((b"x-correlation-id", raw_id))
+
+            # Store in request state for access in endpoints and logging
+            scope.setdefault("state", {})["correlation_id"] = correlation_id
+
+        async def send_with_context(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                headers = extra_headers
+                if self.timing:
+                    # "12.34ms" from integer arithmetic (units of 10µs), no float
+                    process_time = b"%d.%02dms" % divmod(elapsed_ns // 10_000, 100)
+                    headers = [*extra_headers, (b"x-process-time", process_time)]
+                    if elapsed_ns > self._slow_request_ns and logger.isEnabledFor(
+                        logging.WARNING
+                    ):
+                        self._log_slow_request(scope, correlation_id, elapsed_ns)
+
+                # One log record per request, built only when INFO is enabled
+                if scope["path"] not in _QUIET_PATHS and logger.isEnabledFor(
+                    logging.INFO
+                ):
+                    self._log_request(scope, correlation_id, message, elapsed_ns)
+
+                if headers:
+                    message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_context)
+
+    @staticmethod
+    def _log_request(
+        scope: Scope, correlation_id: str | None, message: Message, elapsed_ns: int
+    ) -> None:
+        client = scope.get("client")
+        logger.info(
+            "Request processed",
+            extra={
+                "correlation_id": correlation_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "query_params": str(QueryParams(scope.get("query_string", b""))),
+                "client_ip": client[0] if client else None,
+                "status_code": message["status"],
+                "process_time_ns": elapsed_ns,
+            },
+        )
+
+    @staticmethod
+    def _log_slow_request(
+        scope: Scope, correlation_id: str | None, elapsed_ns: int
+    ) -> None:
+        method = scope["method"]
+        path = scope["path"]
+        process_time_ms = elapsed_ns / 1_000_000
+        logger.warning(
+            f"Slow request detected: {method} {path} took {process_time_ms:.2f}ms",
+            extra={
+                "correlation_id": correlation_id or "unknown",
+                "method": method,
+                "path": path,
+                "process_time_ms": process_time_ms,
+            },
+        )
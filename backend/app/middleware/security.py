@@ -1,59 +1,89 @@
 """Security headers middleware including CSP, HSTS, and other security headers."""
 
-from fastapi import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..config import settings
 
 
-async def security_headers_middleware(request: Request, call_next) -> Response:
+def _build_security_headers() -> dict[str, str]:
     """
-    Add comprehensive security headers to all responses.
-
-    Implements:
-    - Content Security Policy (CSP)
-    - HTTP Strict Transport Security (HSTS)
-    - X-Content-Type-Options
-    - X-Frame-Options
-    - X-XSS-Protection
-    - Referrer-Policy
-    - Permissions-Policy
+    Security headers added to every response.
 
-    Note: This middleware skips WebSocket connections to avoid interference
-    with WebSocket upgrade handshakes.
+    They only depend on the configuration, which is fixed at startup, so they
+    (including the CSP policy) are built once instead of on every request.
     """
-    # Skip WebSocket connections - they don't need security headers
-    # and BaseHTTPMiddleware-style processing breaks them
-    if request.scope.get("type") == "websocket":
-        return await call_next(request)
-
-    response = await call_next(request)
+    headers = {}
 
     # Content Security Policy
     if settings.csp_enabled:
-        response.headers["Content-Security-Policy"] = settings.build_csp_header()
+        headers["Content-Security-Policy"] = settings.build_csp_header()
 
     # Prevent MIME type sniffing
-    response.headers["X-Content-Type-Options"] = "nosniff"
+    headers["X-Content-Type-Options"] = "nosniff"
 
     # Clickjacking protection
-    response.headers["X-Frame-Options"] = settings.frame_options
+    headers["X-Frame-Options"] = settings.frame_options
 
     # XSS Protection (legacy but still useful)
-    response.headers["X-XSS-Protection"] = "1; mode=block"
+    headers["X-XSS-Protection"] = "1; mode=block"
 
     # HSTS (only in production with HTTPS)
     if settings.hsts_enabled and settings.is_production:
-        response.headers["Strict-Transport-Security"] = (
+        headers["Strict-Transport-Security"] = (
             f"max-age={settings.hsts_max_age}; includeSubDomains; preload"
         )
 
     # Referrer Policy
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
 
     # Permissions Policy (restrict browser features)
-    response.headers["Permissions-Policy"] = (
+    headers["Permissions-Policy"] = (
         "geolocation=(), microphone=(), camera=(), payment=(), usb=()"
     )
 
-    return response
+    return headers
+
+
+_SECURITY_HEADERS = _build_security_headers()
+
+
+class SecurityHeadersMiddleware:
+    """
+    Add comprehensive security headers to all responses.
+
+    Implements:
+    - Content Security Policy (CSP)
+    - HTTP Strict Transport Security (HSTS)
+    - X-Content-Type-Options
+    - X-Frame-Options
+    - X-XSS-Protection
+    - Referrer-Policy
+    - Permissions-Policy
+
+    Note: This middleware skips WebSocket connections to avoid interference
+    with WebSocket upgrade handshakes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Raw ASGI header tuples, appended as-is to every response
+        self._header_patches: list[tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in _SECURITY_HEADERS.items()
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip WebSocket connections - they don't need security headers
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *self._header_patches,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
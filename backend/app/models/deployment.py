@@ -9,7 +9,7 @@ from uuid import uuid4
 
 from sqlalchemy import JSON, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -39,6 +39,11 @@ class Deployment(Base):
     """
 
     __tablename__ = "deployments"
+    # Index composites des requêtes multi-tenant (couvrent aussi organization_id seul)
+    __table_args__ = (
+        Index("ix_deploy_org_status", "organization_id", "status"),
+        Index("ix_deploy_org_created", "organization_id", "created_at"),
+    )
 
     # Clé primaire
     id: Mapped[str] = mapped_column(
@@ -65,7 +70,6 @@ class Deployment(Base):
         String(36),
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Informations de déploiement
@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -28,6 +28,11 @@ class Stack(Base):
     """
 
     __tablename__ = "stacks"
+    # Index composites : filtrage par organisation et navigation du marketplace
+    __table_args__ = (
+        Index("ix_stack_org_category", "organization_id", "category"),
+        Index("ix_stack_public_rating", "is_public", "rating"),
+    )
 
     # Clé primaire
     id: Mapped[str] = mapped_column(
@@ -92,7 +97,6 @@ class Stack(Base):
         String(36),
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Timestamps
@@ -8,7 +8,7 @@ from uuid import uuid4
 
 from sqlalchemy import JSON, Boolean, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -29,6 +29,8 @@ class Target(Base):
     """
 
     __tablename__ = "targets"
+    # Index composite des requêtes multi-tenant (couvre aussi organization_id seul)
+    __table_args__ = (Index("ix_target_org_status", "organization_id", "status"),)
 
     # Clé primaire
     id: Mapped[str] = mapped_column(
@@ -83,7 +85,6 @@ class Target(Base):
         String(36),
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Propriétés dérivées (depuis credentials JSON) pour la réponse API
@@ -4,17 +4,24 @@ Service métier pour gestion des utilisateurs.
 Implémente le pattern Repository avec SQLAlchemy 2.0 async.
 """
 
+import asyncio
 from typing import List, Optional, Tuple
 
 from passlib.context import CryptContext
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
 
-# Configuration password hashing avec Argon2
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Configuration password hashing avec Argon2 ; les hashes bcrypt existants restent
+# vérifiables et sont migrés vers Argon2 à la connexion (verify_and_update_user)
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
 
 
 class UserService:
@@ -119,8 +126,9 @@ class UserService:
             ...     # L'utilisateur est authentifié
             ...     pass
         """
-        is_valid, new_hash = UserService.verify_and_update(
-            plain_password, user.hashed_password
+        # Argon2 est coûteux en CPU : calcul hors de la boucle d'événements
+        is_valid, new_hash = await asyncio.to_thread(
+            UserService.verify_and_update, plain_password, user.hashed_password
         )
 
         # Si le mot de passe est valide et qu'un nouveau hash est disponible
@@ -289,8 +297,10 @@ class UserService:
         Returns:
             Utilisateur créé
         """
-        # Hash du mot de passe
-        hashed_password = UserService.hash_password(user_data.password)
+        # Hash du mot de passe, hors de la boucle d'événements
+        hashed_password = await asyncio.to_thread(
+            UserService.hash_password, user_data.password
+        )
 
         # Création du modèle
         user = User(
@@ -323,10 +333,10 @@ class UserService:
         """
         update_data = user_data.model_dump(exclude_unset=True)
 
-        # Hash du nouveau mot de passe si fourni
+        # Hash du nouveau mot de passe si fourni, hors de la boucle d'événements
         if "password" in update_data:
-            update_data["hashed_password"] = UserService.hash_password(
-                update_data.pop("password")
+            update_data["hashed_password"] = await asyncio.to_thread(
+                UserService.hash_password, update_data.pop("password")
             )
 
         # Mise à jour des champs
@@ -0,0 +1,81 @@
+"""
+Tests d'intégration pour les gestionnaires d'exceptions de l'application.
+
+Vérifie que les exceptions non gérées sont converties en réponses JSON
+formatées.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+from app.main import app
+
+
+@pytest.fixture
+def failing_route():
+    """Ajoute temporairement une route qui lève l'exception demandée."""
+    raised: list[Exception] = []
+
+    async def boom():
+        raise raised[0]
+
+    app.add_api_route("/test-boom", boom)
+    route = app.router.routes[-1]
+    yield raised
+    app.router.routes.remove(route)
+
+
+@pytest.fixture
+async def lenient_client():
+    """Client qui ne relance pas les exceptions remontées par l'application."""
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc,expected_error",
+    [
+        (SQLAlchemyError("boom"), "Database Error"),
+        (RuntimeError("boom"), "Internal Server Error"),
+    ],
+)
+async def test_unhandled_exception_returns_json(
+    lenient_client: AsyncClient, failing_route, exc, expected_error
+):
+    """Test qu'une exception non gérée produit une réponse JSON 500."""
+    failing_route.append(exc)
+
+    response = await lenient_client.get("/test-boom")
+
+    assert response.status_code == 500
+    assert response.json()["error"] == expected_error
+    assert response.json()["path"] == "http://test/test-boom"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exc", [SQLAlchemyError("boom"), RuntimeError("boom")])
+async def test_error_response_goes_through_middlewares(failing_route, exc):
+    """Test qu'une réponse 500 reçoit les en-têtes de corrélation, sécurité et CORS."""
+    failing_route.append(exc)
+    origin = settings.cors_origins_list[0]
+
+    # Client strict : aucune exception ne doit remonter jusqu'au serveur
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/test-boom",
+            headers={"X-Correlation-ID": "test-123", "Origin": origin},
+        )
+
+    assert response.status_code == 500
+    assert response.json()["correlation_id"] == "test-123"
+    assert response.headers["X-Correlation-ID"] == "test-123"
+    assert "X-Process-Time" in response.headers
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["Access-Control-Allow-Origin"] == origin
+    # Le détail de l'exception n'est pas exposé hors mode debug
+    assert "boom" not in response.json()["detail"]
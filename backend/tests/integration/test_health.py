@@ -0,0 +1,207 @@
+"""
+Tests d'intégration pour l'endpoint /health.
+
+Vérifie la mise en cache du résultat dans Redis et le repli sur un
+contrôle direct lorsque Redis est indisponible.
+"""
+
+import asyncio
+import json
+import socket
+
+import pytest
+from httpx import AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app import main
+from app.config import settings
+from app.database import db
+
+
+class _FakeRedis:
+    """Client Redis minimal en mémoire (get/setex/ping)."""
+
+    def __init__(self, fail: bool = False):
+        self.store: dict[str, str] = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise RedisConnectionError("down")
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        if self.fail:
+            raise RedisConnectionError("down")
+        self.store[key] = value
+
+    async def ping(self):
+        if self.fail:
+            raise RedisConnectionError("down")
+        return True
+
+
+@pytest.fixture(autouse=True)
+def reset_local_health_cache():
+    """Vide le cache local de /health entre les tests."""
+    main._health_local = None
+    yield
+    main._health_local = None
+
+
+@pytest.fixture
+def fake_redis():
+    """Installe un faux client Redis partagé sur l'application."""
+    previous = getattr(main.app.state, "redis", None)
+    redis_client = _FakeRedis()
+    main.app.state.redis = redis_client
+    yield redis_client
+    main.app.state.redis = previous
+
+
+@pytest.mark.asyncio
+async def test_health_result_is_cached(client: AsyncClient, fake_redis, monkeypatch):
+    """Test que les sondes suivantes sont servies depuis le cache Redis."""
+    calls = 0
+
+    async def counting_health_check():
+        nonlocal calls
+        calls += 1
+        return True
+
+    monkeypatch.setattr(db, "health_check", counting_health_check)
+
+    first = await client.get("/health")
+    second = await client.get("/health")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert main._HEALTH_CACHE_KEY in fake_redis.store
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_health_ignores_other_instances(
+    client: AsyncClient, fake_redis, monkeypatch
+):
+    """Test qu'une instance ne sert pas le résultat mis en cache par une autre."""
+    fake_redis.store["windflow:health:other-host"] = json.dumps(
+        {"status": "unhealthy", "services": {}}
+    )
+
+    async def healthy():
+        return True
+
+    monkeypatch.setattr(db, "health_check", healthy)
+
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert main._HEALTH_CACHE_KEY == f"windflow:health:{socket.gethostname()}"
+    assert main._HEALTH_CACHE_KEY in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_health_without_redis_runs_live(
+    client: AsyncClient, fake_redis, monkeypatch
+):
+    """Test que /health reste disponible si Redis ne répond pas."""
+    fake_redis.fail = True
+
+    async def healthy():
+        return True
+
+    monkeypatch.setattr(db, "health_check", healthy)
+
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_cached_unhealthy_status_keeps_503(
+    client: AsyncClient, fake_redis, monkeypatch
+):
+    """Test qu'un résultat dégradé servi depuis le cache garde le code 503."""
+
+    async def unhealthy():
+        return False
+
+    monkeypatch.setattr(db, "health_check", unhealthy)
+
+    first = await client.get("/health")
+    second = await client.get("/health")
+
+    assert first.status_code == second.status_code == 503
+    assert second.json()["status"] == "unhealthy"
+
+
+@pytest.mark.asyncio
+async def test_database_and_redis_probed_concurrently(
+    client: AsyncClient, fake_redis, monkeypatch
+):
+    """Test que le ping Redis n'attend pas la fin du contrôle de la base."""
+    pinged = asyncio.Event()
+
+    async def ping():
+        pinged.set()
+        return True
+
+    async def waits_for_ping():
+        # En séquentiel, le ping n'aurait lieu qu'après ce contrôle
+        await asyncio.wait_for(pinged.wait(), timeout=1)
+        return True
+
+    fake_redis.ping = ping
+    monkeypatch.setattr(db, "health_check", waits_for_ping)
+    monkeypatch.setattr(settings, "health_cache_ttl", 0)
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "rate_limit_storage_url", "redis://test")
+
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["services"]["rate_limiter"] == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_probes_share_local_cache(client: AsyncClient, monkeypatch):
+    """Test que des sondes simultanées ne déclenchent qu'un seul contrôle."""
+    monkeypatch.setattr(main.app.state, "redis", None, raising=False)
+    calls = 0
+
+    async def slow_health_check():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return True
+
+    monkeypatch.setattr(db, "health_check", slow_health_check)
+
+    responses = await asyncio.gather(*(client.get("/health") for _ in range(5)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_health_reports_recovery_state(client: AsyncClient, monkeypatch):
+    """Test que l'état de la reprise des déploiements est exposé, sans cache."""
+    monkeypatch.setattr(main.app.state, "redis", None, raising=False)
+
+    async def healthy():
+        return True
+
+    monkeypatch.setattr(db, "health_check", healthy)
+    recovery = asyncio.get_running_loop().create_future()
+    monkeypatch.setattr(main.app.state, "recovery_task", recovery, raising=False)
+
+    running = await client.get("/health")
+    recovery.set_exception(RuntimeError("boom"))
+    failed = await client.get("/health")
+
+    assert running.json()["recovery"] == "running"
+    assert failed.json()["recovery"] == "failed"
+    # Un échec de la reprise ne rend pas l'instance indisponible
+    assert failed.status_code == 200
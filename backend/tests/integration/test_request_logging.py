@@ -0,0 +1,35 @@
+"""
+Tests d'intégration pour le logging des requêtes.
+
+Vérifie qu'un enregistrement est produit par requête, sauf pour les
+sondes de santé et la documentation.
+"""
+
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import RequestContextMiddleware
+
+
+async def _empty_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.mark.asyncio
+async def test_probe_paths_are_not_logged(caplog):
+    """Test que /health n'est pas journalisé, contrairement aux autres routes."""
+    transport = ASGITransport(app=RequestContextMiddleware(_empty_app))
+    with caplog.at_level(logging.INFO, logger="app.middleware.request_context"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            probe = await client.get("/health")
+            await client.get("/api/v1/stacks?page=2")
+
+    records = [r for r in caplog.records if r.getMessage() == "Request processed"]
+    assert [r.path for r in records] == ["/api/v1/stacks"]
+    assert records[0].query_params == "page=2"
+    # Les en-têtes restent posés sur les sondes
+    assert "X-Correlation-ID" in probe.headers
+    assert "X-Process-Time" in probe.headers
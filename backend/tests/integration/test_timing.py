@@ -6,7 +6,9 @@ et contient des valeurs cohérentes.
 """
 
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import RequestContextMiddleware
 
 
 @pytest.mark.asyncio
@@ -60,3 +62,20 @@ async def test_process_time_on_error_responses(client: AsyncClient):
     response = await client.get("/api/v1/nonexistent-endpoint")
 
     assert "X-Process-Time" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_timing_can_be_disabled():
+    """Test que X-Process-Time est absent si le timing est désactivé."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = RequestContextMiddleware(app, timing=False)
+    transport = ASGITransport(app=middleware)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/")
+
+    assert "X-Process-Time" not in response.headers
+    assert "X-Correlation-ID" in response.headers
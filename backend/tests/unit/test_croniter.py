@@ -0,0 +1,118 @@
+"""Tests unitaires du calcul à période fixe de croniter (app.helper.croniter)."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.helper.croniter import croniter, croniter_range
+
+START = datetime(2024, 3, 30, 22, 47, 13)
+
+
+class _GenericCroniter(croniter):
+    """croniter sans calcul à période fixe : sert de référence."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fixed_period = None
+
+
+def _series(cls, expr, start, count=50, is_prev=False):
+    it = cls(expr, start)
+    step = it.get_prev if is_prev else it.get_next
+    return [step(datetime) for _ in range(count)]
+
+
+@pytest.mark.parametrize(
+    "expr, period",
+    [
+        # Pas
+        ("*/15 * * * *", 900),
+        ("0 */2 * * *", 7200),
+        ("5-59/10 * * * *", 600),
+        # Listes régulières
+        ("0,30 * * * *", 1800),
+        ("10,30,50 * * * *", 1200),
+        # Valeurs fixes : une fois par jour
+        ("30 2 * * *", 86400),
+        # Champ des secondes
+        ("* * * * * */10", 10),
+        ("*/5 * * * * 30", 300),
+    ],
+)
+@pytest.mark.parametrize("is_prev", [False, True])
+def test_fixed_period_matches_generic(expr, period, is_prev):
+    """Test que le calcul direct donne les mêmes dates que le moteur générique."""
+    assert croniter(expr, START)._fixed_period[0] == period
+
+    assert _series(croniter, expr, START, is_prev=is_prev) == _series(
+        _GenericCroniter, expr, START, is_prev=is_prev
+    )
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        # Liste irrégulière
+        "0,25 * * * *",
+        # '*' mélangé à des valeurs
+        "*,5 * * * *",
+        "0 *,3 * * *",
+        # Champ plus grossier non générique après un pas
+        "*/15 2 * * *",
+        # Champs calendaires : la longueur des mois varie
+        "0 0 */3 * *",
+        "0 0 * * 1",
+        "0 0 * * 1#2",
+    ],
+)
+def test_non_periodic_expressions_use_generic_engine(expr):
+    """Test que les expressions non périodiques ne sont pas détectées."""
+    assert croniter(expr, START)._fixed_period is None
+    assert _series(croniter, expr, START, count=10) == _series(
+        _GenericCroniter, expr, START, count=10
+    )
+
+
+@pytest.mark.parametrize("expr", ["0 */2 * * *", "30 2 * * *", "*/30 * * * *"])
+@pytest.mark.parametrize("is_prev", [False, True])
+def test_timezone_across_dst_matches_generic(expr, is_prev):
+    """Test qu'une date avec fuseau horaire traverse le changement d'heure correctement."""
+    start = datetime(2024, 3, 30, 20, 0, tzinfo=ZoneInfo("Europe/Paris"))
+    if is_prev:
+        start = datetime(2024, 4, 1, 4, 0, tzinfo=ZoneInfo("Europe/Paris"))
+
+    assert _series(croniter, expr, start, is_prev=is_prev) == _series(
+        _GenericCroniter, expr, start, is_prev=is_prev
+    )
+
+
+@pytest.mark.parametrize(
+    "expr", ["*/15 * * * *", "0 */2 * * *", "10,30,50 * * * *", "* * * * * */10"]
+)
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("exclude_ends", [False, True])
+def test_croniter_range_matches_generic(expr, reverse, exclude_ends):
+    """Test que croniter_range à période fixe donne les mêmes dates que le moteur générique."""
+    start, stop = datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 6, 0)
+    if reverse:
+        start, stop = stop, start
+
+    fast = list(croniter_range(start, stop, expr, exclude_ends=exclude_ends))
+    generic = list(
+        croniter_range(
+            start, stop, expr, exclude_ends=exclude_ends, _croniter=_GenericCroniter
+        )
+    )
+
+    assert fast and fast == generic
+
+
+def test_croniter_range_timestamps_match_generic():
+    """Test que croniter_range renvoie les mêmes timestamps que le moteur générique."""
+    start, stop = 1704067200.0, 1704088800.0
+
+    assert list(croniter_range(start, stop, "*/20 * * * *")) == list(
+        croniter_range(start, stop, "*/20 * * * *", _croniter=_GenericCroniter)
+    )
@@ -0,0 +1,86 @@
+"""Tests unitaires pour l'envoi d'emails (file d'envoi et réutilisation de la connexion SMTP)."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.helper import email as email_helper
+
+
+@pytest.fixture
+def smtp_class():
+    """Remplace la classe de connexion SMTP et repart d'un pool vide pour chaque test"""
+    email_helper._smtp_pool.close()
+    with patch.object(email_helper, "_SERVER_CLASS") as smtp:
+        smtp.return_value = MagicMock()
+        yield smtp
+    email_helper._smtp_pool.close()
+
+
+def test_send_now_reuses_connection(smtp_class):
+    """Deux envois successifs partagent la même session SMTP"""
+    email_helper._send_now("a@example.com", "Sujet", "Corps")
+    email_helper._send_now("b@example.com", "Sujet", "Corps")
+
+    smtp_class.assert_called_once_with(email_helper.SMTP_SERVER, email_helper.SMTP_PORT)
+    assert smtp_class.return_value.sendmail.call_count == 2
+
+
+def test_send_now_reconnects_after_disconnect(smtp_class):
+    """Une session coupée par le serveur est rouverte et l'envoi retenté"""
+    stale, fresh = MagicMock(), MagicMock()
+    stale.sendmail.side_effect = email_helper.smtplib.SMTPServerDisconnected()
+    smtp_class.side_effect = [stale, fresh]
+
+    email_helper._send_now("a@example.com", "Sujet", "Corps")
+
+    assert smtp_class.call_count == 2
+    fresh.sendmail.assert_called_once()
+
+
+def test_send_now_renews_idle_connection(smtp_class):
+    """Une connexion inutilisée au-delà du délai est renouvelée"""
+    email_helper._send_now("a@example.com", "Sujet", "Corps")
+    email_helper._smtp_pool._local.last_used -= email_helper.SMTP_IDLE_TIMEOUT + 1
+    email_helper._send_now("b@example.com", "Sujet", "Corps")
+
+    assert smtp_class.call_count == 2
+    smtp_class.return_value.quit.assert_called_once()
+
+
+def test_send_email_is_delivered_in_background():
+    """send_email rend la main immédiatement, l'envoi est fait par le thread dédié"""
+    with patch.object(email_helper, "_send_now") as send_now:
+        email_helper.send_email("a@example.com", "Sujet", "Corps", "html")
+        email_helper._EMAIL_QUEUE.join()
+
+    send_now.assert_called_once_with("a@example.com", "Sujet", "Corps", "html")
+
+
+def test_send_email_batch_enqueues_every_message():
+    """Tous les emails d'un lot passent par la file, dans l'ordre"""
+    messages = [(f"user{i}@example.com", "Sujet", "Corps", "plain") for i in range(5)]
+    with patch.object(email_helper, "_send_now") as send_now:
+        email_helper.send_email_batch(messages)
+        email_helper._EMAIL_QUEUE.join()
+
+    assert [call.args for call in send_now.call_args_list] == messages
+
+
+def test_shutdown_flushes_queued_emails():
+    """Les emails en file à l'arrêt sont envoyés avant la fin du thread d'envoi"""
+    messages = [(f"user{i}@example.com", "Sujet", "Corps", "plain") for i in range(3)]
+
+    def slow_send(*message):
+        time.sleep(0.02)
+
+    with patch.object(email_helper, "_send_now", side_effect=slow_send) as send_now:
+        email_helper.send_email_batch(messages)
+        thread = email_helper._sender_thread
+
+        assert email_helper.shutdown_email_sender(timeout=5)
+
+    assert [call.args for call in send_now.call_args_list] == messages
+    assert not thread.is_alive()
+    assert email_helper._sender_thread is None
@@ -0,0 +1,240 @@
+"""Tests unitaires pour les fonctions Jinja2 des templates de déploiement."""
+
+import base64
+import hashlib
+import socket
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.helper import animalname, codename, cosmicname, mythologyname
+from app.helper.jinja_functions import JinjaFunctions
+
+
+@pytest.mark.parametrize("length", [0, 1, 16, 64, 257])
+def test_generate_password_length_and_alphabet(length):
+    """Le mot de passe a la longueur demandée et reste dans son alphabet."""
+    allowed = set(string.ascii_letters + string.digits + "!@#$%^&*()-_=+")
+
+    password = JinjaFunctions.generate_password(length)
+
+    assert len(password) == length
+    assert set(password) <= allowed
+
+
+def test_generate_password_without_special():
+    """Sans caractères spéciaux, le mot de passe est alphanumérique."""
+    password = JinjaFunctions.generate_password(200, include_special=False)
+
+    assert password.isalnum()
+
+
+def test_generate_password_covers_alphabet():
+    """Tous les caractères de l'alphabet peuvent être tirés."""
+    password = JinjaFunctions.generate_password(20000, include_special=False)
+
+    assert set(password) == set(string.ascii_letters + string.digits)
+
+
+@pytest.mark.parametrize(
+    "charset,allowed",
+    [
+        ("alphanumeric", string.ascii_letters + string.digits),
+        ("alpha", string.ascii_letters),
+        ("numeric", string.digits),
+        ("hex", "0123456789abcdef"),
+    ],
+)
+@pytest.mark.parametrize("length", [0, 1, 7, 32])
+def test_random_string_charsets(charset, allowed, length):
+    """Chaque charset produit la longueur demandée avec ses seuls caractères."""
+    result = JinjaFunctions.random_string(length, charset)
+
+    assert len(result) == length
+    assert set(result) <= set(allowed)
+
+
+def test_random_string_invalid_charset():
+    """Un charset inconnu est refusé."""
+    with pytest.raises(ValueError):
+        JinjaFunctions.random_string(8, "unknown")  # type: ignore[arg-type]
+
+
+def test_random_port_stays_in_range():
+    """Les ports tirés restent dans la plage demandée, bornes incluses."""
+    ports = {JinjaFunctions.random_port(8000, 8003) for _ in range(500)}
+
+    assert ports == {8000, 8001, 8002, 8003}
+
+
+def test_random_port_concurrent_threads():
+    """Des rendus concurrents partagent les tirages sans erreur ni sortie de plage."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ports = list(
+            pool.map(lambda _: JinjaFunctions.random_port(8000, 8003), range(2000))
+        )
+
+    assert set(ports) <= {8000, 8001, 8002, 8003}
+
+
+def test_random_port_empty_range():
+    """Une plage vide est refusée."""
+    with pytest.raises(ValueError):
+        JinjaFunctions.random_port(9000, 8000)
+
+
+def test_now_default_format_is_utc():
+    """Le format par défaut correspond à l'heure UTC courante, à la seconde près."""
+    before = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+    result = JinjaFunctions.now()
+    after = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+    assert before <= result <= after
+
+
+def test_now_custom_format():
+    """Un format personnalisé est appliqué tel quel."""
+    assert JinjaFunctions.now("%Y") == time.strftime("%Y", time.gmtime())
+
+
+def test_env_is_cached_until_cleared(monkeypatch):
+    """Les variables lues sont mises en cache jusqu'à cache_clear()."""
+    JinjaFunctions.env.cache_clear()
+    monkeypatch.setenv("WINDFLOW_TEST_ENV", "first")
+    assert JinjaFunctions.env("WINDFLOW_TEST_ENV") == "first"
+
+    monkeypatch.setenv("WINDFLOW_TEST_ENV", "second")
+    assert JinjaFunctions.env("WINDFLOW_TEST_ENV") == "first"
+
+    JinjaFunctions.env.cache_clear()
+    assert JinjaFunctions.env("WINDFLOW_TEST_ENV") == "second"
+    assert JinjaFunctions.env("WINDFLOW_TEST_MISSING", "default") == "default"
+    JinjaFunctions.env.cache_clear()
+
+
+def test_get_valid_port_skips_busy_ports():
+    """Les ports déjà occupés sont ignorés au profit du suivant."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+        busy.bind(("", 0))
+        busy.listen()
+        busy_port = busy.getsockname()[1]
+
+        port = JinjaFunctions.get_valid_port(busy_port, max_attempts=10)
+
+    assert busy_port < port < busy_port + 10
+
+
+def test_get_valid_port_exhausted():
+    """Sans port libre dans la fenêtre, une RuntimeError est levée."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+        busy.bind(("", 0))
+        busy.listen()
+        busy_port = busy.getsockname()[1]
+
+        with pytest.raises(RuntimeError):
+            JinjaFunctions.get_valid_port(busy_port, max_attempts=1)
+
+
+def test_get_valid_port_randomized_stays_in_window():
+    """En ordre aléatoire, le port retourné reste dans la fenêtre demandée."""
+    ports = {
+        JinjaFunctions.get_valid_port(40000, max_attempts=20, randomize=True)
+        for _ in range(20)
+    }
+
+    assert all(40000 <= port < 40020 for port in ports)
+
+
+def test_get_valid_port_any():
+    """start_port=0 laisse le noyau choisir un port libre."""
+    assert 0 < JinjaFunctions.get_valid_port(0) <= 65535
+
+
+def test_random_choice_seq():
+    """Le choix se fait parmi les éléments de la séquence fournie."""
+    options = ["alpha", "beta", "gamma"]
+
+    assert {JinjaFunctions.random_choice_seq(options) for _ in range(200)} == set(
+        options
+    )
+
+
+def test_random_choice_seq_empty():
+    """Une séquence vide est refusée."""
+    with pytest.raises(ValueError):
+        JinjaFunctions.random_choice_seq([])
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        JinjaFunctions.generate_animalname,
+        JinjaFunctions.generate_cosmicname,
+        JinjaFunctions.generate_mythologyname,
+    ],
+)
+def test_generate_codename_prefix(generator):
+    """Le préfixe est séparé par un tiret ; sans préfixe, pas de tiret initial."""
+    assert generator("web").startswith("web-")
+    assert not generator().startswith("-")
+
+
+@pytest.mark.parametrize("module", [animalname, cosmicname, mythologyname])
+def test_generate_codename_full_style(module):
+    """Le style "full" assemble préfixe, adverbe, adjectif, nom et suffixe."""
+    for _ in range(50):
+        prefix, adverb, adjective, name, suffix = module.generate_codename(
+            style="full"
+        ).split("-", 4)
+        assert len(prefix) == 3 and set(prefix) <= set(codename._ALPHABET)
+        assert adverb in module.adverbs
+        assert adjective in module.adjectives
+        assert name in module.names
+        assert len(suffix) == 4 and set(suffix) <= set(codename._ALPHABET)
+
+
+@pytest.mark.parametrize("module", [animalname, cosmicname, mythologyname])
+def test_generate_codenames_bulk(module):
+    """La génération groupée produit n noms de code au format demandé."""
+    codenames = module.generate_codenames(200, use_adjective=False, suffix_length=2)
+
+    assert len(codenames) == 200
+    for codename in codenames:
+        name, suffix = codename.rsplit("-", 1)
+        assert name in module.names
+        assert len(suffix) == 2
+    assert module.generate_codenames(0) == []
+
+
+@pytest.mark.parametrize(
+    "value", ["", "hello", "é" * 8, "x" * 24, "y" * 25, "z" * 4096]
+)
+def test_base64_round_trip(value):
+    """L'encodage suit base64 standard quelle que soit la taille de l'entrée."""
+    encoded = JinjaFunctions.base64_encode(value)
+
+    assert encoded == base64.b64encode(value.encode("utf-8")).decode("ascii")
+    assert JinjaFunctions.base64_decode(encoded) == value
+
+
+def test_base64_decode_rejects_non_ascii():
+    """Une entrée non ASCII ne peut pas être du base64."""
+    with pytest.raises(ValueError):
+        JinjaFunctions.base64_decode("aGVsbG8é")
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512", "md5", "sha1"])
+def test_hash_value_matches_hashlib(algorithm):
+    """hash_value donne l'empreinte hashlib, y compris sur un appel répété."""
+    expected = hashlib.new(algorithm, "service-é".encode("utf-8")).hexdigest()
+
+    assert JinjaFunctions.hash_value("service-é", algorithm) == expected
+    assert JinjaFunctions.hash_value("service-é", algorithm) == expected
+
+
+def test_hash_value_invalid_algorithm():
+    """Un algorithme inconnu est refusé."""
+    with pytest.raises(ValueError):
+        JinjaFunctions.hash_value("x", "crc32")  # type: ignore[arg-type]
@@ -0,0 +1,140 @@
+"""Tests unitaires pour la vérification des permissions (app.helper.permissions)."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.helper import permissions
+from app.helper.permissions import has_permission, is_in_cron_interval
+
+
+class _Obj:
+    """Objet minimal hachable par identité, comme les entités ORM."""
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+def _rule(rule_id, function, environment_id=None, element_id=None, schedule=None):
+    return _Obj(
+        id=rule_id,
+        function=SimpleNamespace(name=function),
+        environment_id=environment_id,
+        element_id=element_id,
+        access_schedule=schedule,
+    )
+
+
+def _user(group_policies=(), user_policies=(), organization_ids=(1,)):
+    return SimpleNamespace(
+        is_superadmin=False,
+        organizations=[SimpleNamespace(id=org_id) for org_id in organization_ids],
+        groups=[
+            SimpleNamespace(organization_id=policy.organization_id, policies=[policy])
+            for policy in group_policies
+        ],
+        policies=list(user_policies),
+    )
+
+
+def test_superadmin_has_every_permission():
+    user = SimpleNamespace(is_superadmin=True)
+
+    assert has_permission(None, user, permission="deploy")
+
+
+def test_group_policy_grants_permission_case_insensitive():
+    policy = _Obj(organization_id=1, rules=[_rule(1, "deploy")])
+    user = _user(group_policies=[policy])
+
+    assert has_permission(None, user, permission="DEPLOY")
+    assert has_permission(None, user, permission=["read", "Deploy"])
+    assert not has_permission(None, user, permission="read")
+    assert not has_permission(None, user)
+
+
+def test_policy_of_other_organization_is_ignored():
+    policy = _Obj(organization_id=2, rules=[_rule(1, "admin")])
+
+    assert not has_permission(None, _user(user_policies=[policy]), permission="x")
+    assert not has_permission(None, _user(group_policies=[policy]), permission="x")
+
+
+def test_rule_scope_environment_and_element():
+    policy = _Obj(
+        organization_id=1,
+        rules=[_rule(1, "deploy", environment_id=10), _rule(2, "deploy", element_id=7)],
+    )
+    user = _user(user_policies=[policy])
+    element = SimpleNamespace(id=7, environment_id=99)
+
+    assert has_permission(None, user, target_env=10, permission="deploy")
+    assert not has_permission(None, user, target_env=11, permission="deploy")
+    assert has_permission(None, user, target_element=element, permission="deploy")
+    assert not has_permission(None, user, permission="deploy")
+
+
+@pytest.mark.parametrize(
+    "test_dt,expected",
+    [
+        (datetime(2026, 5, 5, 9, 0), True),
+        (datetime(2026, 5, 5, 12, 30, 45), True),
+        (datetime(2026, 5, 5, 17, 0), False),
+        (datetime(2026, 5, 5, 8, 59, 59), False),
+    ],
+)
+def test_is_in_cron_interval(test_dt, expected):
+    """L'intervalle [début, fin[ est défini par deux règles cron."""
+    assert is_in_cron_interval(test_dt, "0 9 * * *", "0 17 * * *") is expected
+
+
+def test_rule_outside_access_schedule_is_skipped():
+    # Fenêtre réduite à la minute de minuit le 1er janvier : fermée pendant les tests
+    closed = _rule(1, "deploy", schedule={"start": "0 0 1 1 *", "end": "1 0 1 1 *"})
+    always = _rule(2, "read", schedule='{"start": "* * * * *", "end": "* * * * *"}')
+    policy = _Obj(organization_id=1, rules=[closed, always])
+    user = _user(user_policies=[policy])
+
+    assert has_permission(None, user, permission="read")
+    assert not has_permission(None, user, permission="deploy")
+
+
+def test_transient_rules_are_checked_separately():
+    """Des règles sans id (non persistées) ne partagent pas leur horaire d'accès."""
+    closed = _rule(None, "deploy", schedule={"start": "0 0 1 1 *", "end": "1 0 1 1 *"})
+    always = _rule(None, "deploy")
+    policy = _Obj(organization_id=1, rules=[closed, always])
+
+    assert has_permission(None, _user(user_policies=[policy]), permission="deploy")
+
+
+def test_seconds_field_schedule_is_not_rounded_to_the_minute(monkeypatch):
+    """Un horaire avec champ secondes est évalué à la seconde, pas au début de la minute."""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2026, 5, 5, 9, 0, 45, 123)
+
+    monkeypatch.setattr(permissions, "datetime", _FrozenDatetime)
+    rule = _rule(1, "deploy", schedule={"start": "0 9 * * * 30", "end": "0 17 * * *"})
+    policy = _Obj(organization_id=1, rules=[rule])
+
+    assert has_permission(None, _user(user_policies=[policy]), permission="deploy")
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [
+        "not json",
+        '["0 9 * * *", "0 17 * * *"]',
+        {"start": "0 9 * * *"},
+        {"start": "invalid cron", "end": "0 17 * * *"},
+    ],
+)
+def test_invalid_access_schedule_allows_access(schedule):
+    """Un horaire mal formé n'empêche pas l'accès."""
+    policy = _Obj(organization_id=1, rules=[_rule(1, "deploy", schedule=schedule)])
+
+    assert has_permission(None, _user(user_policies=[policy]), permission="deploy")
@@ -1,5 +1,6 @@
 """Test simple pour valider le rendu des templates Jinja2 avec fonctions personnalisées."""
 
+from app.helper.template_renderer import TemplateRenderer
 from app.services.deployment_service import DeploymentService
 
 
@@ -124,3 +125,97 @@ def test_render_template_list():
     assert result[0] != result[1]
     # Vérifier que la valeur statique est intacte
     assert result[2] == "static_value"
+
+
+def test_render_template_repeated_renders_are_independent():
+    """Test que la réutilisation d'un template compilé ne fige pas les valeurs générées."""
+    template = {"password": "{{ generate_password(16) }}", "user": "{{ db_user }}"}
+
+    first = DeploymentService._render_template(template, {"db_user": "alice"})
+    second = DeploymentService._render_template(template, {"db_user": "bob"})
+
+    # Les mots de passe sont régénérés à chaque rendu
+    assert first["password"] != second["password"]
+    # Les variables de chaque rendu sont bien prises en compte
+    assert first["user"] == "alice"
+    assert second["user"] == "bob"
+
+
+def test_render_template_literals_unchanged():
+    """Test que les valeurs sans expression Jinja2 sont rendues comme avant."""
+    template = {
+        "user": "admin",
+        "braces": "{ not jinja }",
+        "multi": "a\r\nb",
+        "tail": "x\n",
+    }
+
+    result = DeploymentService._render_template(template, {})
+
+    assert result["user"] == "admin"
+    assert result["braces"] == "{ not jinja }"
+    # Jinja2 normalise les fins de ligne et retire le saut de ligne final
+    assert result["multi"] == "a\nb"
+    assert result["tail"] == "x"
+
+
+def test_render_template_functions_take_precedence_over_variables():
+    """Test qu'une fonction Jinja2 reste prioritaire sur une variable de même nom."""
+    template = {"secret": "{{ generate_secret(8) }}"}
+
+    result = DeploymentService._render_template(template, {"generate_secret": "shadow"})
+
+    assert len(result["secret"]) == 8
+    assert result["secret"] != "shadow"
+
+
+def test_get_available_functions_returns_first_doc_line():
+    """Test que la documentation des fonctions est extraite et non partagée."""
+    renderer = TemplateRenderer()
+
+    functions = renderer.get_available_functions()
+    assert (
+        functions["generate_password"] == "Génère un mot de passe sécurisé aléatoire."
+    )
+
+    # Le résultat peut être modifié sans altérer le cache du renderer
+    functions.clear()
+    assert "generate_password" in renderer.get_available_functions()
+
+
+def test_render_template_deeply_nested_does_not_recurse():
+    """Test qu'un template très imbriqué est rendu sans RecursionError ni modification."""
+    template: dict = {}
+    node = template
+    for _ in range(5000):
+        node["child"] = {}
+        node = node["child"]
+    node["value"] = "{{ name }}"
+
+    result = DeploymentService._render_template(template, {"name": "deep"})
+
+    for _ in range(5000):
+        result = result["child"]
+    assert result == {"value": "deep"}
+    # Le template d'origine est intact
+    assert node == {"value": "{{ name }}"}
+
+
+def test_validate_template_reports_cached_syntax_errors():
+    """Test qu'une erreur de syntaxe mémoïsée est signalée à chaque validation."""
+    renderer = TemplateRenderer()
+    template = {"ok": "{{ name }}", "literal": "plain", "broken": "{{ name "}
+
+    first = renderer.validate_template(template)
+    second = renderer.validate_template(template)
+
+    assert first == second
+    assert first[0] is False
+    assert len(first[1]) == 1 and "root.broken" in first[1][0]
+    # Le rendu conserve la valeur invalide telle quelle
+    renderer.warmup(template)
+    assert renderer.render_dict(template, {"name": "x"}) == {
+        "ok": "x",
+        "literal": "plain",
+        "broken": "{{ name ",
+    }
@@ -1,12 +1,14 @@
 """Tests unitaires pour UserService."""
 
 import pytest
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import Settings, settings
 from app.models.organization import Organization
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.services.user_service import UserService
+from app.services.user_service import UserService, pwd_context
 
 
 @pytest.mark.asyncio
@@ -42,6 +44,22 @@ class TestUserService:
         # Vérifier qu'un mot de passe tronqué ne fonctionne pas (argon2 utilise le mot de passe complet)
         assert not UserService.verify_password(long_password[:72], hashed)
 
+    async def test_verify_and_update_migrates_bcrypt_hash(self):
+        """Test qu'un hash bcrypt est accepté puis remplacé par un hash Argon2."""
+        legacy_hash = pwd_context.hash("password123", scheme="bcrypt")
+
+        assert legacy_hash.startswith("$2b$%02d$" % settings.bcrypt_rounds)
+        is_valid, new_hash = UserService.verify_and_update("password123", legacy_hash)
+
+        assert is_valid
+        assert new_hash is not None and new_hash.startswith("$argon2")
+
+    @pytest.mark.parametrize("rounds", [3, 32])
+    async def test_bcrypt_rounds_out_of_range_rejected(self, rounds):
+        """Test que le facteur de coût bcrypt est borné à la plage 4-31."""
+        with pytest.raises(ValidationError):
+            Settings(bcrypt_rounds=rounds)
+
     async def test_create_user(
         self, db_session: AsyncSession, test_organization: Organization
     ):